@@ -2,10 +2,131 @@
 Flask application factory and configuration.
 """
 
-from flask import Flask, send_from_directory, send_file
+from flask import Flask, Response, current_app, request, send_file
 from flask_cors import CORS
 from flask_restx import Api
+from werkzeug.utils import safe_join
+from functools import lru_cache
+from typing import Optional, Tuple
+import logging
+import mimetypes
 import os
+import time
+
+from .api import menu_ns, health_ns, scanner_ns
+from .models import get_storage
+from .services.file_scanner import FileScanner
+from .utils.serialization import OrjsonProvider, output_json
+
+logger = logging.getLogger(__name__)
+
+
+# 静态文件路径在导入时计算一次，请求处理时直接引用
+STATIC_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'static'))
+ASSETS_ROOT = os.path.join(STATIC_ROOT, 'assets')
+INDEX_PATH = os.path.join(STATIC_ROOT, 'index.html')
+FAVICON_PATH = os.path.join(STATIC_ROOT, 'favicon.ico')
+
+# 静态文件存在性缓存的有效期（秒），过期后重新stat以感知新部署的文件
+STATIC_CACHE_TTL = 5.0
+
+# 浏览器缓存时长（秒）：Vite构建的assets文件名带内容哈希，可永久缓存；
+# index.html每次都需重新验证，命中ETag时返回304
+ASSETS_MAX_AGE = 31536000
+FAVICON_MAX_AGE = 86400
+INDEX_MAX_AGE = 0
+
+# 构建时生成的预压缩文件（index.html.br / index.html.gz），按优先级排列
+PRECOMPRESSED_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# 静态文件目录在本进程中已确认存在，同一进程多次create_app时不再重复检查
+_DIRS_READY = False
+
+
+@lru_cache(maxsize=1024)
+def _resolve_static_cached(file_path: str, ttl_bucket: int) -> Optional[str]:
+    return file_path if os.path.isfile(file_path) else None
+
+
+def _resolve_static(file_path: str) -> Optional[str]:
+    """
+    Resolve a static file path with a short-lived cache.
+    
+    Args:
+        file_path: Absolute path of the static file
+        
+    Returns:
+        The path if the file exists, None otherwise
+    """
+    return _resolve_static_cached(file_path, int(time.monotonic() // STATIC_CACHE_TTL))
+
+
+def _negotiate_precompressed(file_path: str) -> Tuple[Optional[str], str, bool]:
+    """
+    Pick a precompressed sibling of a static file matching Accept-Encoding.
+    
+    Args:
+        file_path: Absolute path of the uncompressed static file
+        
+    Returns:
+        Tuple of (content encoding or None, path to send, whether any variant exists)
+    """
+    has_variant = False
+    for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+        variant_path = _resolve_static(file_path + suffix)
+        if variant_path is None:
+            continue
+        has_variant = True
+        if request.accept_encodings[encoding]:
+            return encoding, variant_path, True
+    return None, file_path, has_variant
+
+
+def _send_static(
+    file_path: str, max_age: int = INDEX_MAX_AGE, immutable: bool = False
+) -> Response:
+    """
+    Send a resolved static file with ETag and Cache-Control headers.
+    
+    When STATIC_ACCEL_REDIRECT is configured only the X-Accel-Redirect
+    header is returned and the front server sends the file body.
+    
+    Args:
+        file_path: Absolute path inside STATIC_ROOT, already checked to exist
+        max_age: Browser cache lifetime in seconds
+        immutable: Whether the file content never changes under this name
+        
+    Returns:
+        Flask response for the file
+    """
+    accel_prefix = current_app.config['STATIC_ACCEL_REDIRECT']
+    if not accel_prefix:
+        encoding, send_path, has_variant = _negotiate_precompressed(file_path)
+        mimetype = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        # ETag由mtime和文件大小生成，不读取文件内容
+        response = send_file(
+            send_path, mimetype=mimetype, conditional=True, etag=True, max_age=max_age
+        )
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        if has_variant:
+            response.vary.add('Accept-Encoding')
+    else:
+        relative_path = os.path.relpath(file_path, STATIC_ROOT)
+        mimetype = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        response = Response(mimetype=mimetype)
+        response.headers['X-Accel-Redirect'] = (
+            accel_prefix.rstrip('/') + '/' + relative_path.replace(os.sep, '/')
+        )
+        if max_age > 0:
+            response.cache_control.public = True
+        else:
+            response.cache_control.no_cache = True
+        response.cache_control.max_age = max_age
+    
+    if immutable:
+        response.cache_control.immutable = True
+    return response
 
 
 def create_app(config_name: str = "development") -> Flask:
@@ -19,6 +140,27 @@ def create_app(config_name: str = "development") -> Flask:
         Configured Flask application instance
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    # 路由默认不区分结尾斜杠，/api/menu/ 直接命中而不是 308 重定向或落入SPA兜底
+    app.url_map.strict_slashes = False
+    
+    if config_name == "production":
+        logger.setLevel(logging.INFO)
+        
+        # send_file 在 WSGI 服务器提供 wsgi.file_wrapper 时走 sendfile 零拷贝发送，
+        # Werkzeug 开发服务器不提供，生产环境应使用 gunicorn / uWSGI
+        file_wrapper_checked = False
+        
+        @app.before_request
+        def check_file_wrapper():
+            nonlocal file_wrapper_checked
+            if file_wrapper_checked:
+                return None
+            file_wrapper_checked = True
+            if 'wsgi.file_wrapper' not in request.environ:
+                logger.warning("WSGI服务器未提供wsgi.file_wrapper，静态文件将经由Python逐块读取发送，"
+                               "生产环境建议使用gunicorn或uWSGI部署")
+            return None
     
     # Configure CORS - 生产环境允许所有来源
     if config_name == "production":
@@ -28,64 +170,77 @@ def create_app(config_name: str = "development") -> Flask:
     
 
     
-    # 静态文件服务（生产环境）- 必须在API之前注册
-    static_folder = os.path.join(os.path.dirname(__file__), '..', 'static')
+    # 静态文件交由前置服务器发送（零拷贝 sendfile），默认关闭
+    # STATIC_ACCEL_REDIRECT: Nginx internal location 前缀，如 /_static_internal/
+    # USE_X_SENDFILE: Apache mod_xsendfile，由 Flask 原生输出 X-Sendfile 头
+    app.config['STATIC_ACCEL_REDIRECT'] = os.getenv('STATIC_ACCEL_REDIRECT', '')
+    app.config['USE_X_SENDFILE'] = (
+        config_name == "production"
+        and os.getenv('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
+    )
+    app.config['SERVE_SPA'] = (
+        os.getenv('SERVE_SPA', 'true').lower() not in ('0', 'false', 'no')
+    )
+    # 扫描菜单目录时并行解析文件的进程数，默认为1，在请求线程内直接解析
+    parse_workers = os.getenv('PARSE_WORKERS', '1').strip()
+    if not parse_workers.isdecimal():
+        logger.warning("PARSE_WORKERS=%r 不是有效的进程数，改为在当前进程解析", parse_workers)
+        parse_workers = '1'
+    app.config['PARSE_WORKERS'] = max(int(parse_workers), 1)
     
-    # 确保静态文件目录存在
-    if not os.path.exists(static_folder):
-        print(f"WARNING: 静态文件目录不存在: {static_folder}")
-        os.makedirs(static_folder, exist_ok=True)
+    # 静态文件服务（生产环境）- 必须在API之前注册
+    # 确保静态文件目录存在，直接尝试创建，已存在时由FileExistsError得知
+    global _DIRS_READY
+    if not _DIRS_READY:
+        try:
+            os.makedirs(STATIC_ROOT)
+            logger.warning("静态文件目录不存在，已创建: %s", STATIC_ROOT)
+        except FileExistsError:
+            pass
+        _DIRS_READY = True
     
     # 根路径路由 - 最高优先级，必须在API注册之前
     @app.route('/')
     def serve_index():
         """服务前端主页"""
-        index_path = os.path.join(static_folder, 'index.html')
-        print(f"DEBUG: 根路径请求，尝试服务index.html: {index_path}")
-        print(f"DEBUG: 文件存在: {os.path.exists(index_path)}")
+        logger.debug("根路径请求，尝试服务index.html: %s", INDEX_PATH)
         
-        if os.path.exists(index_path):
-            print("DEBUG: 成功返回index.html文件")
-            return send_from_directory(static_folder, 'index.html')
+        if _resolve_static(INDEX_PATH):
+            logger.debug("成功返回index.html文件")
+            return _send_static(INDEX_PATH)
         else:
-            print("DEBUG: index.html不存在，返回调试信息")
-            return {
+            logger.debug("index.html不存在，返回调试信息")
+            response = {
                 "message": "食堂菜单系统后端服务运行中", 
-                "status": "ok",
-                "debug": {
-                    "static_folder": static_folder,
-                    "static_exists": os.path.exists(static_folder),
-                    "static_contents": os.listdir(static_folder) if os.path.exists(static_folder) else "目录不存在",
-                    "index_path": index_path
+                "status": "ok"
+            }
+            # 目录列举只在调试模式下执行
+            if app.debug:
+                response["debug"] = {
+                    "static_folder": STATIC_ROOT,
+                    "static_exists": os.path.exists(STATIC_ROOT),
+                    "static_contents": os.listdir(STATIC_ROOT) if os.path.exists(STATIC_ROOT) else "目录不存在",
+                    "index_path": INDEX_PATH
                 }
-            }, 200
+            return response, 200
     
     # 静态资源路由
     @app.route('/assets/<path:filename>')
     def serve_assets(filename):
         """服务静态资源文件"""
-        assets_path = os.path.join(static_folder, 'assets')
-        if os.path.exists(os.path.join(assets_path, filename)):
-            return send_from_directory(assets_path, filename)
+        asset_file = safe_join(ASSETS_ROOT, filename)
+        if asset_file and _resolve_static(asset_file):
+            return _send_static(asset_file, max_age=ASSETS_MAX_AGE, immutable=True)
         return {"error": "Asset not found"}, 404
     
     @app.route('/favicon.ico')
     def serve_favicon():
         """服务favicon"""
-        favicon_path = os.path.join(static_folder, 'favicon.ico')
-        if os.path.exists(favicon_path):
-            return send_from_directory(static_folder, 'favicon.ico')
+        if _resolve_static(FAVICON_PATH):
+            return _send_static(FAVICON_PATH, max_age=FAVICON_MAX_AGE)
         return "", 204
     
-    # 注册API蓝图 - 在静态文件路由之后
-    from app.api import menu_bp
-    from app.api.health import health_bp
-    from app.api.scanner import scanner_bp
-    app.register_blueprint(menu_bp)
-    app.register_blueprint(health_bp)
-    app.register_blueprint(scanner_bp)
-    
-    # Initialize Flask-RESTX API - 在蓝图注册之后
+    # Initialize Flask-RESTX API - 在静态文件路由之后，全应用只有这一个Api
     api = Api(
         app,
         version='1.0',
@@ -93,14 +248,15 @@ def create_app(config_name: str = "development") -> Flask:
         description='API for managing and displaying canteen menus',
         doc='/api/docs/'
     )
+    api.representations['application/json'] = output_json
+    api.add_namespace(menu_ns)
+    api.add_namespace(health_ns)
+    api.add_namespace(scanner_ns)
     
     # 应用启动时自动加载菜单数据
     def auto_load_menu_data():
         """应用启动时自动加载菜单数据"""
         try:
-            from .services.file_scanner import FileScanner
-            from .models import get_storage
-            
             # 检查是否已有数据
             storage = get_storage()
             available_dates = storage.get_available_dates()
@@ -125,29 +281,30 @@ def create_app(config_name: str = "development") -> Flask:
         auto_load_menu_data()
     
     # SPA路由处理 - 最低优先级，捕获所有其他路径
-    @app.route('/<path:path>')
-    def serve_spa(path):
-        """服务SPA路由，但排除API路径"""
-        print(f"DEBUG: SPA路由处理: {path}")
+    # 由Nginx的try_files处理SPA回退时可设置SERVE_SPA=false，Python只处理API请求
+    if app.config['SERVE_SPA']:
+        @app.route('/<path:path>')
+        def serve_spa(path):
+            """服务SPA路由，但排除API路径"""
+            logger.debug("SPA路由处理: %s", path)
         
-        # 排除API路径
-        if path.startswith('api/'):
-            return {"error": "API endpoint not found"}, 404
+            # 排除API路径
+            if path.startswith('api/'):
+                return {"error": "API endpoint not found"}, 404
             
-        # 检查是否是静态文件
-        static_file_path = os.path.join(static_folder, path)
-        if os.path.exists(static_file_path):
-            print(f"DEBUG: 返回静态文件: {path}")
-            return send_from_directory(static_folder, path)
-        else:
-            # SPA路由回退到index.html
-            index_path = os.path.join(static_folder, 'index.html')
-            if os.path.exists(index_path):
-                print(f"DEBUG: SPA回退到index.html")
-                return send_from_directory(static_folder, 'index.html')
+            # 检查是否是静态文件
+            static_file_path = safe_join(STATIC_ROOT, path)
+            if static_file_path and _resolve_static(static_file_path):
+                logger.debug("返回静态文件: %s", path)
+                return _send_static(static_file_path)
             else:
-                print(f"DEBUG: 文件未找到: {path}")
-                return {"error": "File not found", "path": path}, 404
+                # SPA路由回退到index.html
+                if _resolve_static(INDEX_PATH):
+                    logger.debug("SPA回退到index.html")
+                    return _send_static(INDEX_PATH)
+                else:
+                    logger.debug("文件未找到: %s", path)
+                    return {"error": "File not found", "path": path}, 404
     
     return app
 
@@ -1,7 +1,9 @@
 """
-API blueprints for the Canteen Menu System.
+API namespaces for the Canteen Menu System.
 """
 
-from .menu import menu_bp
+from .menu import ns as menu_ns
+from .health import ns as health_ns
+from .scanner import ns as scanner_ns
 
-__all__ = ['menu_bp']
\ No newline at end of file
+__all__ = ['menu_ns', 'health_ns', 'scanner_ns']
\ No newline at end of file
@@ -2,54 +2,67 @@
 Health check API endpoint for monitoring application status.
 """
 
-from flask import Blueprint, jsonify
-from flask_restx import Api, Resource, fields
+from flask import Response, current_app, jsonify, request
+from flask_restx import Namespace, Resource
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, Tuple
+import time
 
-health_bp = Blueprint('health', __name__, url_prefix='/api')
-api = Api(health_bp, doc=False)  # Disable docs for individual blueprints
+from ..utils.serialization import dumps
+from ..utils.timezone import format_datetime
+from .models import health_response_model, register_models
 
-# API models for documentation
-health_response_model = api.model('HealthResponse', {
-    'status': fields.String(required=True, description='Health status (healthy/unhealthy)'),
-    'timestamp': fields.String(required=True, description='Current server timestamp'),
-    'version': fields.String(description='Application version'),
-    'uptime': fields.String(description='Server uptime information'),
-    'services': fields.Raw(description='Status of dependent services')
-})
+ns = Namespace('health', description='健康检查', path='/api')
+register_models(ns, health_response_model)
 
 
-@api.route('/health')
+# 进程启动时间，与存储版本一起组成ETag，避免重启后版本号重复
+_STARTED_AT = int(time.time())
+
+# 固定为健康状态的依赖服务，只需构建一次
+BASE_SERVICES_STATUS = {
+    'storage': 'healthy',  # In-memory storage is always available
+    'excel_parser': 'healthy',  # Excel parser service
+}
+
+# ping响应体缓存：(时间戳字符串, 序列化后的JSON字节)，时间戳每秒变化一次时才重新序列化
+_PONG_CACHE: Tuple[str, bytes] = ('', b'')
+
+
+@ns.route('/health')
 class HealthResource(Resource):
     """Health check endpoint."""
     
-    @api.doc('health_check')
-    @api.marshal_with(health_response_model)
-    def get(self) -> Dict[str, Any]:
+    @ns.doc('health_check')
+    @ns.response(200, 'Success', health_response_model)
+    @ns.response(304, 'Storage unchanged since the ETag was issued')
+    def get(self) -> Any:
         """
         Get application health status.
         
         Returns basic health information including timestamp,
-        version, and status of dependent services.
+        version, and status of dependent services. Responses carry an
+        ETag derived from the storage version, so pollers sending
+        If-None-Match get 304 while the menu data is unchanged.
         """
         try:
             # Basic health check
-            from ..utils.timezone import now
             from ..models import get_storage
-            current_time = now()
             
-            # 检查菜单数据状态
             storage = get_storage()
+            etag = f'{_STARTED_AT}-{storage.version}'
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+                response.set_etag(etag, weak=True)
+                return response
+            
+            # 检查菜单数据状态
             available_dates = storage.get_available_dates()
             menu_status = 'healthy' if available_dates else 'no_data'
             
             # Check dependent services (can be extended)
-            services_status = {
-                'storage': 'healthy',  # In-memory storage is always available
-                'excel_parser': 'healthy',  # Excel parser service
-                'menu_data': menu_status,  # 菜单数据状态
-            }
+            services_status = dict(BASE_SERVICES_STATUS)
+            services_status['menu_data'] = menu_status  # 菜单数据状态
             
             # 添加菜单数据信息
             menu_info = {
@@ -67,15 +80,14 @@ class HealthResource(Resource):
             
             return {
                 'status': overall_status,
-                'timestamp': current_time.isoformat(),
+                'timestamp': format_datetime(),
                 'version': '1.0.0',  # Can be read from config or environment
                 'uptime': 'Available',  # Can be calculated from start time
                 'services': services_status,
                 'menu_info': menu_info
-            }
+            }, 200, {'ETag': f'W/"{etag}"'}
             
         except Exception as e:
-            from ..utils.timezone import format_datetime
             return {
                 'status': 'unhealthy',
                 'timestamp': format_datetime(),
@@ -83,19 +95,21 @@ class HealthResource(Resource):
             }, 500
 
 
-@api.route('/ping')
+@ns.route('/ping')
 class PingResource(Resource):
     """Simple ping endpoint for basic connectivity check."""
     
-    @api.doc('ping')
-    def get(self) -> Dict[str, str]:
+    @ns.doc('ping')
+    def get(self) -> Response:
         """
         Simple ping endpoint.
         
         Returns a basic pong response for connectivity testing.
         """
-        from ..utils.timezone import format_datetime
-        return {
-            'message': 'pong',
-            'timestamp': format_datetime()
-        }
\ No newline at end of file
+        global _PONG_CACHE
+        timestamp = format_datetime()
+        cached_timestamp, body = _PONG_CACHE
+        if cached_timestamp != timestamp:
+            body = dumps({'message': 'pong', 'timestamp': timestamp})
+            _PONG_CACHE = (timestamp, body)
+        return current_app.response_class(body, mimetype='application/json')
\ No newline at end of file
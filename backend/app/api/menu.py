@@ -2,55 +2,112 @@
 Menu API endpoints for retrieving menu data and available dates.
 """
 
-from flask import Blueprint, jsonify, request
-from flask_restx import Api, Resource, fields
+from flask import Response, jsonify, request
+from flask_restx import Namespace, Resource
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from app.models import get_storage
-from datetime import datetime
-
-menu_bp = Blueprint('menu', __name__, url_prefix='/api')
-api = Api(menu_bp, doc=False)  # Disable docs for individual blueprints
-
-# API models for documentation
-menu_item_model = api.model('MenuItem', {
-    'name': fields.String(required=True, description='Food item name'),
-    'description': fields.String(description='Food item description'),
-    'category': fields.String(description='Food category'),
-    'price': fields.Float(description='Item price')
-})
-
-meal_model = api.model('Meal', {
-    'type': fields.String(required=True, description='Meal type (breakfast/lunch/dinner)'),
-    'time': fields.String(required=True, description='Meal time in HH:MM format'),
-    'items': fields.List(fields.Nested(menu_item_model), required=True)
-})
-
-menu_response_model = api.model('MenuResponse', {
-    'date': fields.String(required=True, description='Menu date in YYYY-MM-DD format'),
-    'meals': fields.List(fields.Nested(meal_model), required=True),
-    'requestedDate': fields.String(description='Originally requested date (if different from returned date)'),
-    'fallback': fields.Boolean(description='Whether this is a fallback menu'),
-    'message': fields.String(description='Additional information about the response')
-})
-
-dates_response_model = api.model('DatesResponse', {
-    'dates': fields.List(fields.String, required=True, description='Available menu dates'),
-    'count': fields.Integer(required=True, description='Number of available dates'),
-    'dateRange': fields.Raw(description='Date range with start and end dates'),
-    'currentDate': fields.String(description='Current date in YYYY-MM-DD format'),
-    'hasCurrentDate': fields.Boolean(description='Whether current date has menu data'),
-    'mostRecentDate': fields.String(description='Most recent date with menu data')
-})
-
-
-@api.route('/menu')
+from app.models import menu_storage
+from app.utils.serialization import PreparedJson, prepare_json, prepared_json_response
+from app.utils.timezone import is_valid_date_str, today_str
+from .models import (
+    dates_response_model, meal_model, menu_item_model, menu_response_model, register_models
+)
+
+ns = Namespace('menu', description='菜单查询', path='/api')
+register_models(ns, menu_item_model, meal_model, menu_response_model, dates_response_model)
+
+
+def _build_menu_response(date_param: Optional[str], current_date: str) -> Dict[str, Any]:
+    """
+    Build the menu response for a date, falling back to the most recent menu.
+    
+    Args:
+        date_param: Requested date in YYYY-MM-DD format, or None for today
+        current_date: Today's date in YYYY-MM-DD format
+        
+    Returns:
+        Menu response dictionary
+    """
+    requested_date = date_param or current_date
+    menu_data, is_fallback = menu_storage.resolve_menu(requested_date)
+    
+    if menu_data is None:
+        # No data available at all
+        return {
+            'date': requested_date,
+            'meals': [],
+            'message': 'No menu data available'
+        }
+    
+    result = menu_data.to_dict()
+    if is_fallback:
+        if date_param:
+            # Return fallback menu but indicate the actual date requested
+            result['requestedDate'] = date_param
+            result['message'] = f'No menu found for {date_param}, showing most recent menu from {menu_data.date}'
+        else:
+            result['message'] = f'No menu for today ({current_date}), showing most recent menu from {menu_data.date}'
+        result['fallback'] = True
+    
+    return result
+
+
+def _build_dates_response(current_date: str) -> Dict[str, Any]:
+    """
+    Build the available dates response.
+    
+    Args:
+        current_date: Today's date in YYYY-MM-DD format
+        
+    Returns:
+        Dates response dictionary
+    """
+    storage = menu_storage
+    dates = storage.get_available_dates()
+    date_range = storage.get_date_range()
+    
+    response = {
+        'dates': dates,
+        'count': len(dates),
+        'dateRange': {
+            'start': date_range[0] if date_range else None,
+            'end': date_range[1] if date_range else None
+        }
+    }
+    
+    # Add current date information
+    response['currentDate'] = current_date
+    response['hasCurrentDate'] = current_date in dates
+    
+    # Add most recent date information
+    if dates:
+        response['mostRecentDate'] = dates[-1]
+    
+    return response
+
+
+# 序列化结果按存储版本缓存：菜单数据只在扫描/加载时变化，
+# 同一版本下相同参数的GET请求直接返回已序列化的JSON及其gzip压缩体和ETag。
+# 这两个读接口不经过Flask-RESTX的marshal，响应字典由上面的构建函数按模型组装，
+# 可选字段不适用时直接省略；模型仍通过@ns.response保留在API文档中
+@lru_cache(maxsize=256)
+def _cached_menu_json(date_param: Optional[str], current_date: str, version: int) -> PreparedJson:
+    return prepare_json(_build_menu_response(date_param, current_date))
+
+
+@lru_cache(maxsize=32)
+def _cached_dates_json(current_date: str, version: int) -> PreparedJson:
+    return prepare_json(_build_dates_response(current_date))
+
+
+@ns.route('/menu')
 class MenuResource(Resource):
     """Menu data retrieval endpoint."""
     
-    @api.doc('get_menu')
-    @api.param('date', 'Menu date in YYYY-MM-DD format', type='string')
-    @api.marshal_with(menu_response_model)
-    def get(self) -> Dict[str, Any]:
+    @ns.doc('get_menu')
+    @ns.param('date', 'Menu date in YYYY-MM-DD format', type='string')
+    @ns.response(200, 'Success', menu_response_model)
+    def get(self) -> Response:
         """
         Get menu data for a specific date.
         
@@ -61,113 +118,45 @@ class MenuResource(Resource):
         
         if date_param:
             # Validate date format
-            try:
-                datetime.strptime(date_param, '%Y-%m-%d')
-            except ValueError:
+            if not is_valid_date_str(date_param):
                 return {
                     'status': 'error',
                     'message': 'Invalid date format. Use YYYY-MM-DD.'
                 }, 400
-            
-            # Get menu for specific date
-            storage = get_storage()
-            menu_data = storage.get_menu_by_date(date_param)
-            
-            # If no menu for specific date, implement fallback logic
-            if menu_data is None:
-                fallback_menu = storage.get_most_recent_menu()
-                if fallback_menu is not None:
-                    # Return fallback menu but indicate the actual date requested
-                    result = fallback_menu.to_dict()
-                    result['requestedDate'] = date_param
-                    result['fallback'] = True
-                    result['message'] = f'No menu found for {date_param}, showing most recent menu from {fallback_menu.date}'
-                    return result
-                else:
-                    # No data available at all
-                    return {
-                        'date': date_param,
-                        'meals': [],
-                        'message': 'No menu data available'
-                    }
-            
-            return menu_data.to_dict()
-        else:
-            # Get current date menu or most recent if no date specified
-            from ..utils.timezone import today_str
-            storage = get_storage()
-            current_date = today_str()
-            menu_data = storage.get_menu_by_date(current_date)
-            
-            if menu_data is None:
-                # Fallback to most recent menu
-                menu_data = storage.get_most_recent_menu()
-                if menu_data is not None:
-                    result = menu_data.to_dict()
-                    result['fallback'] = True
-                    result['message'] = f'No menu for today ({current_date}), showing most recent menu from {menu_data.date}'
-                    return result
-                else:
-                    return {
-                        'date': current_date,
-                        'meals': [],
-                        'message': 'No menu data available'
-                    }
-            
-            return menu_data.to_dict()
-
-
-@api.route('/dates')
+        
+        return prepared_json_response(
+            _cached_menu_json(date_param or None, today_str(), menu_storage.version)
+        )
+
+
+@ns.route('/dates')
 class DatesResource(Resource):
     """Available dates endpoint."""
     
-    @api.doc('get_dates')
-    @api.marshal_with(dates_response_model)
-    def get(self) -> Dict[str, Any]:
+    @ns.doc('get_dates')
+    @ns.response(200, 'Success', dates_response_model)
+    def get(self) -> Response:
         """
         Get list of available menu dates.
         
         Returns all dates for which menu data is available,
         along with metadata about the date range and count.
         """
-        storage = get_storage()
-        dates = storage.get_available_dates()
-        date_range = storage.get_date_range()
-        
-        response = {
-            'dates': dates,
-            'count': len(dates),
-            'dateRange': {
-                'start': date_range[0] if date_range else None,
-                'end': date_range[1] if date_range else None
-            }
-        }
-        
-        # Add current date information
-        from ..utils.timezone import today_str
-        current_date = today_str()
-        response['currentDate'] = current_date
-        response['hasCurrentDate'] = current_date in dates
-        
-        # Add most recent date information
-        if dates:
-            response['mostRecentDate'] = dates[-1]
-        
-        return response
+        return prepared_json_response(_cached_dates_json(today_str(), menu_storage.version))
 
 
-@api.route('/specialty-dates')
+@ns.route('/specialty-dates')
 class SpecialtyDatesResource(Resource):
     """Specialty dates endpoint."""
     
-    @api.doc('get_specialty_dates')
+    @ns.doc('get_specialty_dates')
     def get(self) -> Dict[str, Any]:
         """
         Get list of dates that have specialty dishes (档口特色).
         
         Returns all dates for which specialty dishes are available.
         """
-        storage = get_storage()
+        storage = menu_storage
         dates = storage.get_available_dates()
         specialty_dates = []
         
@@ -0,0 +1,91 @@
+"""
+Flask-RESTX models describing the API responses.
+
+Models are plain Model objects created once per process and registered
+on the namespace that documents them with register_models().
+"""
+
+from flask_restx import Model, Namespace, fields
+
+
+# 菜单接口
+menu_item_model = Model('MenuItem', {
+    'name': fields.String(required=True, description='Food item name'),
+    'description': fields.String(description='Food item description'),
+    'category': fields.String(description='Food category'),
+    'price': fields.Float(description='Item price'),
+    'order': fields.Integer(description='Item order within the meal'),
+    'category_order': fields.Integer(description='Category order within the meal')
+})
+
+meal_model = Model('Meal', {
+    'type': fields.String(
+        required=True, description='Meal type (breakfast/lunch/dinner)'
+    ),
+    'time': fields.String(required=True, description='Meal time in HH:MM format'),
+    'items': fields.List(fields.Nested(menu_item_model), required=True)
+})
+
+menu_response_model = Model('MenuResponse', {
+    'date': fields.String(required=True, description='Menu date in YYYY-MM-DD format'),
+    'meals': fields.List(fields.Nested(meal_model), required=True),
+    'requestedDate': fields.String(
+        description='Originally requested date (if different from returned date)'
+    ),
+    'fallback': fields.Boolean(description='Whether this is a fallback menu'),
+    'message': fields.String(description='Additional information about the response')
+})
+
+dates_response_model = Model('DatesResponse', {
+    'dates': fields.List(
+        fields.String, required=True, description='Available menu dates'
+    ),
+    'count': fields.Integer(required=True, description='Number of available dates'),
+    'dateRange': fields.Raw(description='Date range with start and end dates'),
+    'currentDate': fields.String(description='Current date in YYYY-MM-DD format'),
+    'hasCurrentDate': fields.Boolean(description='Whether current date has menu data'),
+    'mostRecentDate': fields.String(description='Most recent date with menu data')
+})
+
+# 健康检查接口
+health_response_model = Model('HealthResponse', {
+    'status': fields.String(
+        required=True, description='Health status (healthy/unhealthy)'
+    ),
+    'timestamp': fields.String(required=True, description='Current server timestamp'),
+    'version': fields.String(description='Application version'),
+    'uptime': fields.String(description='Server uptime information'),
+    'services': fields.Raw(description='Status of dependent services'),
+    'menu_info': fields.Raw(description='Menu data count and date range'),
+    'error': fields.String(description='Error message when unhealthy')
+})
+
+# 文件扫描接口
+scan_result_model = Model('ScanResult', {
+    'success': fields.Boolean(required=True, description='扫描是否成功'),
+    'message': fields.String(required=True, description='扫描结果消息'),
+    'loaded_files': fields.List(fields.Raw, description='成功加载的文件列表'),
+    'failed_files': fields.List(fields.Raw, description='加载失败的文件列表'),
+    'total_menus': fields.Integer(description='总共加载的菜单数量')
+})
+
+scan_status_model = Model('ScanStatus', {
+    'menu_directory': fields.String(description='菜单文件目录'),
+    'directory_exists': fields.Boolean(description='目录是否存在'),
+    'excel_files_count': fields.Integer(description='Excel文件数量'),
+    'excel_files': fields.List(fields.String, description='Excel文件列表'),
+    'loaded_menus_count': fields.Integer(description='已加载菜单数量'),
+    'available_dates': fields.List(fields.String, description='可用日期列表')
+})
+
+
+def register_models(ns: Namespace, *models: Model) -> None:
+    """
+    Register models on a namespace so they appear in the Swagger document.
+
+    Args:
+        ns: Namespace documenting the models
+        models: Models to register, nested models included
+    """
+    for model in models:
+        ns.add_model(model.name, model)
@@ -1,44 +1,27 @@
 """
 文件扫描API端点
 """
-from flask import Blueprint, jsonify
-from flask_restx import Api, Resource, fields
+from flask import jsonify
+from flask_restx import Namespace, Resource
 import logging
 
 from ..services.file_scanner import FileScanner
+from .models import register_models, scan_result_model, scan_status_model
 
 logger = logging.getLogger(__name__)
 
-# 创建蓝图
-scanner_bp = Blueprint('scanner', __name__, url_prefix='/api/scanner')
-api = Api(scanner_bp, doc='/scanner/', title='文件扫描API', description='自动扫描和加载菜单文件')
+# 创建命名空间，由应用中唯一的Api统一注册
+ns = Namespace('scanner', description='自动扫描和加载菜单文件', path='/api/scanner')
+register_models(ns, scan_result_model, scan_status_model)
 
 # 创建文件扫描器实例，使用自动路径检测
 file_scanner = FileScanner()
 
-# API模型定义
-scan_result_model = api.model('ScanResult', {
-    'success': fields.Boolean(required=True, description='扫描是否成功'),
-    'message': fields.String(required=True, description='扫描结果消息'),
-    'loaded_files': fields.List(fields.Raw, description='成功加载的文件列表'),
-    'failed_files': fields.List(fields.Raw, description='加载失败的文件列表'),
-    'total_menus': fields.Integer(description='总共加载的菜单数量')
-})
 
-scan_status_model = api.model('ScanStatus', {
-    'menu_directory': fields.String(description='菜单文件目录'),
-    'directory_exists': fields.Boolean(description='目录是否存在'),
-    'excel_files_count': fields.Integer(description='Excel文件数量'),
-    'excel_files': fields.List(fields.String, description='Excel文件列表'),
-    'loaded_menus_count': fields.Integer(description='已加载菜单数量'),
-    'available_dates': fields.List(fields.String, description='可用日期列表')
-})
-
-
-@api.route('/scan')
+@ns.route('/scan')
 class ScanFiles(Resource):
-    @api.doc('scan_files')
-    @api.marshal_with(scan_result_model)
+    @ns.doc('scan_files')
+    @ns.response(200, 'Success', scan_result_model)
     def post(self):
         """扫描并加载menu目录下的所有Excel文件"""
         try:
@@ -60,10 +43,10 @@ class ScanFiles(Resource):
             }, 500
 
 
-@api.route('/status')
+@ns.route('/status')
 class ScanStatus(Resource):
-    @api.doc('scan_status')
-    @api.marshal_with(scan_status_model)
+    @ns.doc('scan_status')
+    @ns.response(200, 'Success', scan_status_model)
     def get(self):
         """获取文件扫描状态"""
         try:
@@ -83,10 +66,10 @@ class ScanStatus(Resource):
             }, 500
 
 
-@api.route('/auto-load')
+@ns.route('/auto-load')
 class AutoLoad(Resource):
-    @api.doc('auto_load')
-    @api.marshal_with(scan_result_model)
+    @ns.doc('auto_load')
+    @ns.response(200, 'Success', scan_result_model)
     def get(self):
         """自动加载菜单文件（如果还没有数据的话）"""
         try:
@@ -121,9 +104,9 @@ class AutoLoad(Resource):
             }, 500
 
 
-@api.route('/clear-cache')
+@ns.route('/clear-cache')
 class ClearCache(Resource):
-    @api.doc('clear_cache')
+    @ns.doc('clear_cache')
     def post(self):
         """清除所有缓存的菜单数据"""
         try:
@@ -144,10 +127,10 @@ class ClearCache(Resource):
             }, 500
 
 
-@api.route('/refresh')
+@ns.route('/refresh')
 class RefreshMenus(Resource):
-    @api.doc('refresh_menus')
-    @api.marshal_with(scan_result_model)
+    @ns.doc('refresh_menus')
+    @ns.response(200, 'Success', scan_result_model)
     def post(self):
         """清除缓存并重新扫描加载菜单文件"""
         try:
@@ -3,21 +3,17 @@ Models package for the Canteen Menu System.
 """
 
 from .menu import MenuItem, Meal, MenuData
-from .storage import MenuStorage
-
-# 创建全局存储实例（单例模式）
-_storage_instance = None
+from .storage import MenuStorage, menu_storage
 
 def get_storage() -> MenuStorage:
     """
     获取全局存储实例（单例模式）
     
+    存储实例在storage模块导入时创建，这里直接返回，不再逐次检查
+    
     Returns:
         MenuStorage: 全局存储实例
     """
-    global _storage_instance
-    if _storage_instance is None:
-        _storage_instance = MenuStorage()
-    return _storage_instance
+    return menu_storage
 
-__all__ = ['MenuItem', 'Meal', 'MenuData', 'MenuStorage', 'get_storage']
\ No newline at end of file
+__all__ = ['MenuItem', 'Meal', 'MenuData', 'MenuStorage', 'menu_storage', 'get_storage']
\ No newline at end of file
@@ -3,12 +3,25 @@ Menu data models for the Canteen Menu System.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-import json
+from typing import List, Optional, Dict, Any, Tuple, Iterable
+import re
+import sys
 
+import orjson
 
-@dataclass
+from ..utils.timezone import is_valid_date_str
+
+
+# Python 3.10+ 的 dataclass 支持 slots，去掉实例 __dict__，大量菜品常驻内存时可明显减少占用
+DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# HH:MM 格式校验，与 datetime.strptime(time, '%H:%M') 一致，允许一位数的小时和分钟
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{1,2})\Z', re.ASCII)
+
+_VALID_MEAL_TYPES = frozenset({'breakfast', 'lunch', 'dinner'})
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class MenuItem:
     """
     Represents a single menu item (food dish).
@@ -28,6 +41,11 @@ class MenuItem:
     order: int = 0
     category_order: int = 0
     
+    def __post_init__(self) -> None:
+        # 同一分类名在整份菜单中大量重复，驻留后所有菜品共享同一个字符串对象
+        if type(self.category) is str:
+            self.category = sys.intern(self.category)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert MenuItem to dictionary for serialization."""
         return {
@@ -67,7 +85,17 @@ class MenuItem:
         return True
 
 
-@dataclass
+def _item_sort_key(item: MenuItem) -> Tuple[int, int]:
+    """Sort key of a menu item: category order, then item order."""
+    return (item.category_order, item.order)
+
+
+def _meal_sort_key(meal: 'Meal') -> str:
+    """Sort key of a meal: its HH:MM time."""
+    return meal.time
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Meal:
     """
     Represents a meal (breakfast, lunch, dinner) with its items.
@@ -75,21 +103,24 @@ class Meal:
     Attributes:
         type: Type of meal ('breakfast', 'lunch', 'dinner')
         time: Time of the meal in HH:MM format
-        items: List of MenuItem objects for this meal
+        items: List of MenuItem objects for this meal, kept sorted by
+            category order and item order; add items through add_item()
+            or add_items()
     """
     type: str
     time: str
     items: List[MenuItem] = field(default_factory=list)
     
+    def __post_init__(self) -> None:
+        # 创建时排序一次，序列化时直接按列表顺序输出
+        self.items.sort(key=_item_sort_key)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert Meal to dictionary for serialization."""
-        # 对菜品按分类顺序和菜品顺序排序
-        sorted_items = sorted(self.items, key=lambda item: (item.category_order, item.order))
-        
         return {
             'type': self.type,
             'time': self.time,
-            'items': [item.to_dict() for item in sorted_items]
+            'items': [item.to_dict() for item in self.items]
         }
     
     @classmethod
@@ -110,27 +141,42 @@ class Meal:
             True if valid, False otherwise
         """
         # Validate meal type
-        valid_types = {'breakfast', 'lunch', 'dinner'}
-        if self.type not in valid_types:
+        if self.type not in _VALID_MEAL_TYPES:
             return False
         
         # Validate time format (HH:MM)
-        try:
-            datetime.strptime(self.time, '%H:%M')
-        except ValueError:
+        match = _TIME_RE.match(self.time)
+        if match is None or int(match.group(1)) > 23 or int(match.group(2)) > 59:
             return False
         
-        # Validate all items
-        for item in self.items:
-            if not item.validate():
-                return False
-                
-        return True
+        # Validate all items, stopping at the first invalid one
+        return all(item.validate() for item in self.items)
     
     def add_item(self, item: MenuItem) -> None:
         """Add a menu item to this meal."""
         if item.validate():
             self.items.append(item)
+            # 解析器按顺序添加菜品，只有乱序插入时才需要重新排序（稳定排序，保持同序菜品的添加顺序）
+            if len(self.items) > 1 and _item_sort_key(item) < _item_sort_key(self.items[-2]):
+                self.items.sort(key=_item_sort_key)
+    
+    def add_items(self, items: Iterable[MenuItem]) -> None:
+        """
+        Add several menu items at once, skipping invalid ones.
+        
+        The items end up in the same order as adding them one by one with
+        add_item(), but the list is sorted at most once.
+        
+        Args:
+            items: MenuItem objects to add
+        """
+        start = len(self.items)
+        self.items.extend(item for item in items if item.validate())
+        # 新增菜品与前一个菜品逐个比较，出现乱序时整体稳定排序一次
+        for i in range(max(start, 1), len(self.items)):
+            if _item_sort_key(self.items[i]) < _item_sort_key(self.items[i - 1]):
+                self.items.sort(key=_item_sort_key)
+                break
     
     def remove_item(self, item_name: str) -> bool:
         """
@@ -149,26 +195,37 @@ class Meal:
         return False
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class MenuData:
     """
     Represents menu data for a specific date.
     
     Attributes:
         date: Date in YYYY-MM-DD format
-        meals: List of Meal objects for this date
+        meals: List of Meal objects for this date, kept sorted by time;
+            add meals through add_meal()
     """
     date: str
     meals: List[Meal] = field(default_factory=list)
+    # 餐次类型 -> 该类型中时间最早的餐次，供get_meal_by_type直接查找
+    _meals_by_type: Dict[str, Meal] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # 餐次按时间保持有序
+        self.meals.sort(key=_meal_sort_key)
+        self._index_meals()
+    
+    def _index_meals(self) -> None:
+        """Rebuild the meal type index from the time-sorted meals."""
+        self._meals_by_type = {}
+        for meal in self.meals:
+            self._meals_by_type.setdefault(meal.type, meal)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert MenuData to dictionary for serialization."""
-        # 对餐次按时间排序
-        sorted_meals = sorted(self.meals, key=lambda meal: meal.time)
-        
         return {
             'date': self.date,
-            'meals': [meal.to_dict() for meal in sorted_meals]
+            'meals': [meal.to_dict() for meal in self.meals]
         }
     
     @classmethod
@@ -182,12 +239,12 @@ class MenuData:
     
     def to_json(self) -> str:
         """Convert MenuData to JSON string."""
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode('utf-8')
     
     @classmethod
     def from_json(cls, json_str: str) -> 'MenuData':
         """Create MenuData from JSON string."""
-        data = json.loads(json_str)
+        data = orjson.loads(json_str)
         return cls.from_dict(data)
     
     def validate(self) -> bool:
@@ -198,22 +255,21 @@ class MenuData:
             True if valid, False otherwise
         """
         # Validate date format (YYYY-MM-DD)
-        try:
-            datetime.strptime(self.date, '%Y-%m-%d')
-        except ValueError:
+        if not is_valid_date_str(self.date):
             return False
         
-        # Validate all meals
-        for meal in self.meals:
-            if not meal.validate():
-                return False
-                
-        return True
+        # Validate all meals, stopping at the first invalid one
+        return all(meal.validate() for meal in self.meals)
     
     def add_meal(self, meal: Meal) -> None:
         """Add a meal to this menu date."""
         if meal.validate():
             self.meals.append(meal)
+            if len(self.meals) > 1 and meal.time < self.meals[-2].time:
+                self.meals.sort(key=_meal_sort_key)
+                self._index_meals()
+            else:
+                self._meals_by_type.setdefault(meal.type, meal)
     
     def get_meal_by_type(self, meal_type: str) -> Optional[Meal]:
         """
@@ -222,13 +278,19 @@ class MenuData:
         Args:
             meal_type: Type of meal to find
             
+        Meals appended to the meals list directly, not through add_meal(),
+        are found by a scan of the list.
+        
         Returns:
             Meal object if found, None otherwise
         """
-        for meal in self.meals:
-            if meal.type == meal_type:
-                return meal
-        return None
+        meal = self._meals_by_type.get(meal_type)
+        if meal is None:
+            # 索引未命中时按列表顺序查找，命中后补入索引
+            meal = next((candidate for candidate in self.meals if candidate.type == meal_type), None)
+            if meal is not None:
+                self._meals_by_type[meal_type] = meal
+        return meal
     
     def get_meals_sorted_by_time(self) -> List[Meal]:
         """
@@ -237,4 +299,4 @@ class MenuData:
         Returns:
             List of meals sorted by time
         """
-        return sorted(self.meals, key=lambda meal: meal.time)
\ No newline at end of file
+        return list(self.meals)
\ No newline at end of file
@@ -5,6 +5,7 @@ In-memory storage for menu data.
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, date
 from .menu import MenuData, Meal
+import bisect
 import threading
 
 
@@ -15,13 +16,29 @@ class MenuStorage:
     This class provides thread-safe operations for storing and retrieving
     menu data. It maintains data in memory and provides methods for
     CRUD operations on menu data.
+    
+    Menu data is copy-on-write: writers build a new dict and sorted date
+    tuple under the lock and rebind them together as one snapshot, so
+    readers work on an immutable snapshot without locking.
     """
     
     def __init__(self):
         """Initialize the storage with empty data structures."""
-        self._menu_data: Dict[str, MenuData] = {}
+        # (日期 -> MenuData, 升序日期元组)，只整体替换，从不原地修改
+        self._snapshot: Tuple[Dict[str, MenuData], Tuple[str, ...]] = ({}, ())
         self._uploaded_files: List[str] = []
-        self._lock = threading.RLock()  # Reentrant lock for thread safety
+        self._version = 0  # Incremented on every mutation, used as a cache key
+        self._lock = threading.RLock()  # Serializes writers only
+    
+    @property
+    def version(self) -> int:
+        """
+        Get the current data version.
+        
+        Returns:
+            Counter that changes whenever stored menu data changes
+        """
+        return self._version
     
     def store_menu_data(self, menu_data: MenuData) -> bool:
         """
@@ -37,9 +54,42 @@ class MenuStorage:
             return False
             
         with self._lock:
-            self._menu_data[menu_data.date] = menu_data
+            menu_map, dates = self._snapshot
+            if menu_data.date not in menu_map:
+                date_list = list(dates)
+                bisect.insort(date_list, menu_data.date)
+                dates = tuple(date_list)
+            menu_map = dict(menu_map)
+            menu_map[menu_data.date] = menu_data
+            # 先发布新数据再递增版本号，读到新版本号的读者一定能读到新数据
+            self._snapshot = (menu_map, dates)
+            self._version += 1
             return True
     
+    def store_many(self, menu_data_list: List[MenuData]) -> int:
+        """
+        Store several menus with a single snapshot rebuild.
+        
+        Validation runs before the lock is taken; invalid menus are skipped.
+        
+        Args:
+            menu_data_list: MenuData objects to store
+            
+        Returns:
+            Number of menus stored
+        """
+        valid_menus = [menu_data for menu_data in menu_data_list if menu_data.validate()]
+        if not valid_menus:
+            return 0
+        
+        with self._lock:
+            menu_map = dict(self._snapshot[0])
+            for menu_data in valid_menus:
+                menu_map[menu_data.date] = menu_data
+            self._snapshot = (menu_map, tuple(sorted(menu_map)))
+            self._version += 1
+        return len(valid_menus)
+    
     def get_menu_by_date(self, date_str: str) -> Optional[MenuData]:
         """
         Retrieve menu data for a specific date.
@@ -50,8 +100,7 @@ class MenuStorage:
         Returns:
             MenuData object if found, None otherwise
         """
-        with self._lock:
-            return self._menu_data.get(date_str)
+        return self._snapshot[0].get(date_str)
     
     def get_available_dates(self) -> List[str]:
         """
@@ -60,9 +109,7 @@ class MenuStorage:
         Returns:
             Sorted list of date strings in YYYY-MM-DD format
         """
-        with self._lock:
-            dates = list(self._menu_data.keys())
-            return sorted(dates)
+        return list(self._snapshot[1])
     
     def get_date_range(self) -> Optional[Tuple[str, str]]:
         """
@@ -71,7 +118,7 @@ class MenuStorage:
         Returns:
             Tuple of (start_date, end_date) or None if no data
         """
-        dates = self.get_available_dates()
+        dates = self._snapshot[1]
         if not dates:
             return None
         return (dates[0], dates[-1])
@@ -83,12 +130,10 @@ class MenuStorage:
         Returns:
             MenuData object for the most recent date, None if no data
         """
-        dates = self.get_available_dates()
+        menu_map, dates = self._snapshot
         if not dates:
             return None
-        
-        most_recent_date = dates[-1]
-        return self.get_menu_by_date(most_recent_date)
+        return menu_map[dates[-1]]
     
     def get_menu_or_fallback(self, date_str: str) -> Optional[MenuData]:
         """
@@ -100,12 +145,29 @@ class MenuStorage:
         Returns:
             MenuData object for requested date or most recent available
         """
-        menu = self.get_menu_by_date(date_str)
-        if menu is not None:
-            return menu
+        return self.resolve_menu(date_str)[0]
+    
+    def resolve_menu(self, date_str: Optional[str]) -> Tuple[Optional[MenuData], bool]:
+        """
+        Resolve the menu for a date, falling back to the most recent menu.
+        
+        Both lookups read the same snapshot of the menu data.
         
-        # Fallback to most recent menu
-        return self.get_most_recent_menu()
+        Args:
+            date_str: Requested date in YYYY-MM-DD format, or None
+            
+        Returns:
+            Tuple of (MenuData or None if no data, whether it is a fallback)
+        """
+        menu_map, dates = self._snapshot  # 两次查找使用同一个快照
+        if date_str is not None:
+            menu = menu_map.get(date_str)
+            if menu is not None:
+                return menu, False
+        
+        if not dates:
+            return None, False
+        return menu_map[dates[-1]], True
     
     def update_menu_data(self, date_str: str, meals: List[Meal]) -> bool:
         """
@@ -132,16 +194,23 @@ class MenuStorage:
             True if deleted, False if date not found
         """
         with self._lock:
-            if date_str in self._menu_data:
-                del self._menu_data[date_str]
+            menu_map, dates = self._snapshot
+            if date_str in menu_map:
+                menu_map = dict(menu_map)
+                del menu_map[date_str]
+                date_list = list(dates)
+                del date_list[bisect.bisect_left(date_list, date_str)]
+                self._snapshot = (menu_map, tuple(date_list))
+                self._version += 1
                 return True
             return False
     
     def clear_all_data(self) -> None:
         """Clear all stored menu data."""
         with self._lock:
-            self._menu_data.clear()
+            self._snapshot = ({}, ())
             self._uploaded_files.clear()
+            self._version += 1
     
     def add_uploaded_file(self, filename: str) -> None:
         """
@@ -171,8 +240,7 @@ class MenuStorage:
         Returns:
             Number of menu dates stored
         """
-        with self._lock:
-            return len(self._menu_data)
+        return len(self._snapshot[1])
     
     def has_menu_for_date(self, date_str: str) -> bool:
         """
@@ -184,8 +252,7 @@ class MenuStorage:
         Returns:
             True if menu exists for the date, False otherwise
         """
-        with self._lock:
-            return date_str in self._menu_data
+        return date_str in self._snapshot[0]
     
     def get_all_menu_data(self) -> Dict[str, MenuData]:
         """
@@ -194,8 +261,7 @@ class MenuStorage:
         Returns:
             Dictionary mapping dates to MenuData objects
         """
-        with self._lock:
-            return self._menu_data.copy()
+        return self._snapshot[0].copy()
 
 
 # Global storage instance
@@ -5,20 +5,148 @@ This module provides functionality to parse Excel files containing menu data
 and convert them into structured MenuData objects.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
-from typing import List, Optional, Dict, Any, Union, Tuple
+from typing import List, Optional, Dict, Any, Union, Tuple, Iterable
 from datetime import datetime, date
+from functools import lru_cache
+from itertools import compress
+from operator import attrgetter, itemgetter
 import re
 import logging
+import multiprocessing
 import os
+import threading
 from pathlib import Path
 
 from ..models.menu import MenuData, Meal, MenuItem
+from ..utils.timezone import is_valid_date_str
 
 
 logger = logging.getLogger(__name__)
 
+# 解析过程中反复使用的正则，模块加载时编译一次
+_FOOD_SEPARATOR_RE = re.compile(r'[,，、/\\|]')
+_WEEKLY_FOOD_SEPARATOR_RE = re.compile(r'[，,、/]')  # 星期格式单元格内的多个菜品
+_ITEM_SEPARATOR_RE = re.compile(r'[,，、；;]')  # 横向格式单元格内的多个菜品
+_FILENAME_DAY_RANGE_RE = re.compile(r'(\d+)月(\d+)-(\d+)')  # 如：12月29-31
+_TIME_PREFIX_RE = re.compile(r'^(\d{1,2}):(\d{2})')  # 开头的 HH:MM，分组为时和分
+_TITLE_DATE_RE = re.compile(r'(\d+)月(\d+)[-–]?(\d*)日?')  # 如：食堂菜单（1月4-9日）
+_FILENAME_YEAR_RANGE_RE = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日?[-–](\d{1,2})日?')  # 如：2026年1月4日-9日
+_FILENAME_MONTH_RANGE_RE = re.compile(r'(\d{1,2})月(\d{1,2})日?[-–](\d{1,2})日?')  # 如：1月4-9日
+_DIGIT_RE = re.compile(r'\d')  # 推断列类型时，不含数字的文本不可能是日期
+
+# 文件头标识：xlsx 等 ZIP 容器格式，以及 xls 等 OLE2 复合文档格式
+_ZIP_MAGIC = b'PK\x03\x04'
+_OLE2_MAGIC = b'\xd0\xcf\x11\xe0'
+
+# 单元格转为文本后表示空值的写法（NaN、pd.NA 以及空串）
+_EMPTY_CELL_TEXTS = frozenset(('', 'nan', 'NaN', '<NA>'))
+_MEAL_MARKERS = frozenset(('早餐', '午餐', '晚餐'))
+# 按列名识别时只取第一个命中列的列类型
+_FIRST_MATCH_COLUMN_TYPES = frozenset(('date', 'time'))
+
+# 横向格式标题区中的餐次标识 -> 标准餐次，需与单元格内容完全一致
+_HEADER_MEAL_TYPES = {
+    '早餐': 'breakfast', 'breakfast': 'breakfast',
+    '午餐': 'lunch', '中餐': 'lunch', 'lunch': 'lunch',
+    '晚餐': 'dinner', 'dinner': 'dinner',
+}
+
+# 星期格式表头中的星期写法，按星期数排列
+_WEEKDAY_NAMES = ('星期一', '星期二', '星期三', '星期四', '星期五', '星期六', '星期日')
+_WEEKDAY_INDEX = {weekday: index for index, weekday in enumerate(_WEEKDAY_NAMES)}
+
+# 星期格式转换为标准格式时，第一列中的餐次标识和需要跳过的类别行
+_CONVERT_MEAL_MARKERS = frozenset(('早餐', '午餐', '晚餐', 'breakfast', 'lunch', 'dinner'))
+_CONVERT_SKIPPED_CATEGORIES = frozenset((
+    '类别', '油炸食品', '小菜类', '营养鸡蛋', '粥品', '饮品类', '包点', '清炒时蔬', '传统风味',
+))
+
+# 星期标题中的写法 -> 星期数（周一为0），按顺序匹配，长写法在前
+_WEEKDAY_NUMBERS = {
+    '星期天': 6, '星期日': 6, '周日': 6, '日': 6,
+    '星期一': 0, '周一': 0, '一': 0,
+    '星期二': 1, '周二': 1, '二': 1,
+    '星期三': 2, '周三': 2, '三': 2,
+    '星期四': 3, '周四': 3, '四': 3,
+    '星期五': 4, '周五': 4, '五': 4,
+    '星期六': 5, '周六': 5, '六': 5,
+}
+
+# 各餐次的默认时间，未知餐次按午餐处理
+_DEFAULT_MEAL_TIMES = {
+    'breakfast': '07:30',
+    'lunch': '12:00',
+    'dinner': '18:00',
+}
+
+# 判断分类名称用到的词表
+_KNOWN_CATEGORIES = frozenset((
+    '油炸食品', '小菜类', '营养鸡蛋', '粥品', '饮品类', '包点', '清炒时蔬', '传统风味',
+    '荤类', '半荤素', '蔬菜', '主食/面点', '控糖主食', '免费例汤', '炖罐', '捞化档口',
+    '水果酸奶', '档口特色', '营养例汤', '盖浇饭套餐', '每日下午外卖包点',
+))
+_CATEGORY_KEYWORDS = ('类', '品', '食', '汤', '罐', '档', '奶', '特色', '套餐', '包点', '主食', '例汤')
+# 菜品描述词汇（这些通常出现在具体菜品名称中）
+_DISH_KEYWORDS = ('红烧', '清蒸', '白灼', '爆炒', '糖醋', '麻辣', '香辣', '蒜蓉', '葱爆', '宫保')
+# 每组关键词编译为一个多选正则，一次扫描文本即可判断是否包含其中任一词
+_CATEGORY_KEYWORD_RE = re.compile('|'.join(map(re.escape, _CATEGORY_KEYWORDS)))
+_DISH_KEYWORD_RE = re.compile('|'.join(map(re.escape, _DISH_KEYWORDS)))
+
+
+def _clean_cell(value: Any) -> Any:
+    """Strip a cell as text, turning the 'nan' text of empty cells into pd.NA."""
+    text = str(value).strip()
+    return pd.NA if text == 'nan' else text
+
+
+# 逐元素作用于二维object数组，一次处理所有文本列
+_clean_cells = np.frompyfunc(_clean_cell, 1, 1)
+
+
+@lru_cache(maxsize=256)
+def _filename_day_range_dates(filename: str, year: int) -> Optional[Tuple[str, ...]]:
+    """
+    Dates of a day range in a filename such as '菜单12月29-31', in the given year.
+    
+    Each file is tried against several formats that all need these dates,
+    so results are memoized per (filename, year).
+    
+    Args:
+        filename: Name of the source file
+        year: Year the dates fall in
+        
+    Returns:
+        YYYY-MM-DD strings with invalid days skipped, or None if the
+        filename has no day range
+    """
+    match = _FILENAME_DAY_RANGE_RE.search(filename)
+    if not match:
+        return None
+    
+    month = int(match.group(1))
+    dates = []
+    for day in range(int(match.group(2)), int(match.group(3)) + 1):
+        try:
+            dates.append(date(year, month, day).isoformat())
+        except ValueError:
+            continue
+    return tuple(dates)
+
+
+def _cell_text(value: Any) -> str:
+    """Text of a cell as the parsers compare it: str() of the value, stripped."""
+    return str(value).strip()
+
+
+# 整表一次转换为单元格文本网格，各解析步骤按位置读取，不再逐格 str().strip()
+_cell_texts = np.frompyfunc(_cell_text, 1, 1)
+
 
 class ExcelParsingError(Exception):
     """Custom exception for Excel parsing errors."""
@@ -44,6 +172,14 @@ class ExcelParser:
         '%m月%d日',       # Chinese format: 12月15日
     ]
     
+    # DATE_FORMATS按分隔符分组，组内保持原顺序。格式中的分隔符是字面量，
+    # 字符串中没有该分隔符时整组格式都不可能匹配，只需尝试命中的一组
+    DATE_FORMAT_GROUPS = (
+        ('月', ('%Y年%m月%d日', '%m月%d日')),
+        ('-', ('%Y-%m-%d', '%d-%m-%Y', '%m-%d-%Y')),
+        ('/', ('%Y/%m/%d', '%d/%m/%Y', '%m/%d/%Y')),
+    )
+    
     # Common meal type mappings (case-insensitive)
     MEAL_TYPE_MAPPINGS = {
         'breakfast': ['breakfast', '早餐', '早饭', '早点', 'morning'],
@@ -51,6 +187,34 @@ class ExcelParser:
         'dinner': ['dinner', '晚餐', '晚饭', '晚点', 'evening', 'supper']
     }
     
+    # 写法 -> 标准餐次；各写法之间不存在子串包含关系，精确命中与子串匹配结果一致
+    MEAL_TYPE_LOOKUP = {
+        variation: standard_type
+        for standard_type, variations in MEAL_TYPE_MAPPINGS.items()
+        for variation in variations
+    }
+    
+    # 每种餐次的所有写法编译为一个正则，按 MEAL_TYPE_MAPPINGS 的顺序逐个搜索，
+    # 文本同时包含多种餐次的写法时仍以靠前的餐次为准
+    MEAL_TYPE_PATTERNS = tuple(
+        (standard_type, re.compile('|'.join(map(re.escape, variations))))
+        for standard_type, variations in MEAL_TYPE_MAPPINGS.items()
+    )
+    
+    # 列名关键字，按优先级排列：列名命中靠前的类型后不再匹配其余类型。
+    # 每种类型的关键字编译为一个正则，每个列名每种类型只搜索一次
+    COLUMN_NAME_PATTERNS = tuple(
+        (column_type, re.compile('|'.join(map(re.escape, keywords))))
+        for column_type, keywords in (
+            ('date', ('date', '日期', '时间', 'time')),
+            ('meal_type', ('meal', 'type', '餐次', '类型')),
+            ('time', ('time', '时间', 'hour')),
+            ('food_name', ('food', 'name', '菜名', '食物', 'dish')),
+            ('description', ('desc', '描述', '说明', 'detail')),
+            ('category', ('category', '类别', '分类', 'cat')),
+        )
+    )
+    
     def __init__(self):
         """Initialize the Excel parser."""
         self.supported_extensions = {'.xlsx', '.xls', '.csv', '.et'}
@@ -66,12 +230,16 @@ class ExcelParser:
             True if file format is supported, False otherwise
         """
         try:
-            path = Path(file_path)
-            return path.suffix.lower() in self.supported_extensions
+            return self._file_extension(file_path) in self.supported_extensions
         except Exception as e:
             logger.error(f"Error validating file format: {e}")
             return False
     
+    @staticmethod
+    def _file_extension(file_path: Union[str, Path]) -> str:
+        """Lower-cased extension of a path, like Path.suffix but without building a Path."""
+        return os.path.splitext(os.fspath(file_path))[1].lower()
+    
     def parse_excel_file(self, file_path: Union[str, Path]) -> List[MenuData]:
         """
         Parse an Excel file and extract menu data.
@@ -89,40 +257,13 @@ class ExcelParser:
             raise ExcelParsingError(f"Unsupported file format. Supported formats: {self.supported_extensions}")
         
         try:
-            # Store filename for date extraction
-            self._current_filename = os.path.basename(str(file_path))
-            
-            # 检查文件扩展名
-            file_extension = Path(file_path).suffix.lower()
-            
-            if file_extension == '.csv':
-                # 读取CSV文件
-                df = pd.read_csv(file_path, encoding='utf-8')
-            elif file_extension == '.et':
-                # 处理WPS表格文件(.et格式)
-                df = self._parse_et_file(file_path)
-            else:
-                # 处理Excel文件
-                # Try to load the workbook first to check if it's a valid Excel file
-                workbook = None
-                try:
-                    workbook = load_workbook(file_path, read_only=True)
-                    # Close workbook immediately after validation
-                    workbook.close()
-                except Exception as e:
-                    if workbook:
-                        workbook.close()
-                    raise e
-                
-                # Read the Excel file with pandas for easier data manipulation
-                # Use context manager to ensure proper file closure
-                with pd.ExcelFile(file_path) as excel_file:
-                    df = pd.read_excel(excel_file, sheet_name=0)  # Read first sheet
+            df = self._read_first_sheet(file_path)
             
             if df.empty:
                 raise ExcelParsingError("文件为空")
             
-            return self._extract_menu_data(df)
+            # 文件名作为参数向下传递，解析器实例不保存单次解析的状态，可在多线程间共享
+            return self._extract_menu_data(df, os.path.basename(str(file_path)))
             
         except FileNotFoundError:
             raise ExcelParsingError(f"File not found: {file_path}")
@@ -131,17 +272,83 @@ class ExcelParser:
         except Exception as e:
             logger.error(f"Error parsing Excel file {file_path}: {e}")
             raise ExcelParsingError(f"Failed to parse Excel file: {str(e)}")
+    
+    def _read_first_sheet(self, file_path: Union[str, Path]) -> pd.DataFrame:
+        """
+        Read the first sheet of a file into a DataFrame, opening the file once.
+        
+        The reader is chosen by file extension.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            DataFrame of the first sheet
+        """
+        file_extension = self._file_extension(file_path)
+        
+        if file_extension == '.csv':
+            # 读取CSV文件
+            return pd.read_csv(file_path, encoding='utf-8')
+        
+        if file_extension == '.et':
+            # 处理WPS表格文件(.et格式)
+            return self._parse_et_file(file_path)
+        
+        if file_extension == '.xls':
+            # 旧版二进制格式 openpyxl 无法读取，交给 xlrd 一次读出第一个工作表
+            return pd.read_excel(file_path, sheet_name=0, engine='xlrd')
+        
+        # 处理Excel文件
+        # 只加载一次工作簿：read_only 按行流式解析XML，data_only 只读取公式的缓存值，
+        # 加载失败即说明不是有效的Excel文件
+        workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            # 将已加载的工作簿交给pandas，避免按路径再次解压解析
+            # pandas 会对只读工作表调用 reset_dimensions()，不受错误的维度信息影响
+            with pd.ExcelFile(workbook, engine='openpyxl') as excel_file:
+                return excel_file.parse(sheet_name=0)  # Read first sheet
         finally:
-            # Clean up filename reference
-            if hasattr(self, '_current_filename'):
-                delattr(self, '_current_filename')
+            workbook.close()
+    
+    @staticmethod
+    def parse_many(file_paths: List[Union[str, Path]],
+                   workers: Optional[int] = None) -> List[Union[List[MenuData], Exception]]:
+        """
+        Parse several files in parallel worker processes.
+        
+        Parsing is CPU-bound, so worker processes scale across cores where
+        threads would take turns on the GIL. A file that fails to parse yields
+        its exception instead of failing the whole batch.
+        
+        Args:
+            file_paths: Paths of the files to parse
+            workers: Number of worker processes, defaults to the CPU count; the
+                pool is created on first use and reused by later calls
+            
+        Returns:
+            For each file in input order, its parsed menus or the raised exception
+        """
+        workers = workers or os.cpu_count() or 1
+        if min(workers, len(file_paths)) <= 1:
+            # 单个文件或单核时直接在当前进程解析，省去传输结果的开销
+            return [_parse_file(file_path) for file_path in file_paths]
+        
+        try:
+            return list(_get_parse_pool(workers).map(_parse_file, file_paths))
+        except BrokenProcessPool as e:
+            # 工作进程异常退出后进程池不可再用，丢弃它，本批文件改为在当前进程解析
+            logger.warning(f"解析进程池已失效，改为在当前进程解析: {e}")
+            _discard_parse_pool()
+            return [_parse_file(file_path) for file_path in file_paths]
     
-    def _extract_menu_data(self, df: pd.DataFrame) -> List[MenuData]:
+    def _extract_menu_data(self, df: pd.DataFrame, filename: str = '') -> List[MenuData]:
         """
         Extract menu data from a pandas DataFrame.
         
         Args:
             df: DataFrame containing the Excel data
+            filename: Name of the source file, used to read the menu's date range
             
         Returns:
             List of MenuData objects
@@ -149,57 +356,60 @@ class ExcelParser:
         # Clean the DataFrame
         df = self._clean_dataframe(df)
         
+        # 各格式解析器的表头检查先在这里完成，表头不符的格式直接跳过，
+        # 不再进入解析器后抛出异常再回退
+        
         # Try horizontal weekly format first (new format with weekdays as columns)
-        try:
-            return self._parse_horizontal_weekly_format(df)
-        except Exception as e:
-            logger.info(f"Horizontal weekly format parsing failed: {e}, trying standard weekly format")
+        weekday_headers = self._find_weekday_headers(df)
+        if weekday_headers[1]:
+            try:
+                return self._parse_horizontal_weekly_format(df, filename, weekday_headers)
+            except Exception as e:
+                logger.info(f"Horizontal weekly format parsing failed: {e}, trying standard weekly format")
         
         # Try weekly format (Chinese canteen style)
-        try:
-            return self._parse_weekly_format(df)
-        except Exception as e:
-            logger.info(f"Weekly format parsing failed: {e}, trying standard format")
+        if self._weekly_header_mask(df.to_numpy(dtype=object)).any():
+            try:
+                return self._parse_weekly_format(df, filename)
+            except Exception as e:
+                logger.info(f"Weekly format parsing failed: {e}, trying standard format")
         
         # Fall back to standard column-based format
-        return self._parse_standard_format(df)
+        return self._parse_standard_format(df, filename)
     
-    def _parse_weekly_format(self, df: pd.DataFrame) -> List[MenuData]:
+    def _parse_weekly_format(self, df: pd.DataFrame, filename: str = '') -> List[MenuData]:
         """
         Parse weekly menu format (Chinese canteen style).
         
         Args:
             df: DataFrame with weekly menu structure
+            filename: Name of the source file, used to read the menu's date range
             
         Returns:
             List of MenuData objects
         """
         menu_data_dict = {}
+        meal_cache: Dict[Tuple[str, str], Meal] = {}  # (日期, 餐次) -> Meal
+        
+        # 一次取出所有单元格及其文本，扫描时按位置直接读取，不再逐格调用 df.iloc
+        cells = df.to_numpy(dtype=object)
+        texts = _cell_texts(cells)
         
-        # 查找包含星期信息的行
+        # 查找包含星期信息的行：取第一个含"星期"单元格的行
         weekday_row_idx = None
         weekday_cols = {}
         
-        for row_idx in range(min(10, len(df))):
-            found_weekday_in_row = False
-            for col_idx in range(1, len(df.columns)):  # 跳过第一列
-                try:
-                    cell_value = str(df.iloc[row_idx, col_idx]).strip()
-                    if '星期' in cell_value:
-                        if weekday_row_idx is None:
-                            weekday_row_idx = row_idx
-                        found_weekday_in_row = True
-                        # 映射列索引到星期
-                        weekdays = ['星期一', '星期二', '星期三', '星期四', '星期五', '星期六', '星期日']
-                        for weekday in weekdays:
-                            if weekday in cell_value:
-                                weekday_cols[col_idx] = weekday
-                                break  # 找到匹配的星期后跳出weekdays循环
-                except:
-                    continue
-            # 如果这一行找到了星期信息，继续检查这一行的其他列，但不检查其他行
-            if found_weekday_in_row:
-                break
+        has_weekday = self._weekly_header_mask(cells)
+        rows_with_weekday = np.flatnonzero(has_weekday.any(axis=1))
+        if rows_with_weekday.size:
+            weekday_row_idx = int(rows_with_weekday[0])
+            # 映射该行各列到星期
+            for col_idx in np.flatnonzero(has_weekday[weekday_row_idx]) + 1:
+                cell_value = texts[weekday_row_idx, col_idx]
+                for weekday in _WEEKDAY_NAMES:
+                    if weekday in cell_value:
+                        weekday_cols[int(col_idx)] = weekday
+                        break  # 找到匹配的星期后跳出weekdays循环
         
         if not weekday_cols:
             raise ExcelParsingError("Could not find weekday information in weekly format")
@@ -211,27 +421,11 @@ class ExcelParser:
         current_year_val = current_year()
         
         # 尝试从文件名中提取月份和日期范围
-        filename = getattr(self, '_current_filename', '')
         logger.info(f"处理文件: {filename}")
         
         # 解析文件名中的日期信息（如：12月29-31）
-        import re
-        date_match = re.search(r'(\d+)月(\d+)-(\d+)', filename)
-        if date_match:
-            month = int(date_match.group(1))
-            start_day = int(date_match.group(2))
-            end_day = int(date_match.group(3))
-            
-            # 生成日期列表
-            dates = []
-            for day in range(start_day, end_day + 1):
-                try:
-                    from datetime import datetime
-                    date_obj = datetime(current_year_val, month, day)
-                    dates.append(date_obj.strftime('%Y-%m-%d'))
-                except ValueError:
-                    continue
-            
+        dates = _filename_day_range_dates(filename, current_year_val)
+        if dates is not None:
             logger.info(f"解析出的日期: {dates}")
             
             if not dates:
@@ -240,14 +434,19 @@ class ExcelParser:
             
             # 映射星期到日期
             weekday_to_date = {}
-            weekday_names = ['星期一', '星期二', '星期三', '星期四', '星期五', '星期六', '星期日']
             for col_idx, weekday in weekday_cols.items():
-                weekday_index = weekday_names.index(weekday)
+                weekday_index = _WEEKDAY_INDEX[weekday]
                 if weekday_index < len(dates):
                     weekday_to_date[col_idx] = dates[weekday_index]
             
             logger.info(f"星期到日期映射: {weekday_to_date}")
             
+            # 各星期列的非空标记整块一次算出，逐行扫描时只处理有菜品的单元格
+            date_columns = list(weekday_to_date.items())
+            food_present = ~np.isin(texts[:, list(weekday_to_date)], list(_EMPTY_CELL_TEXTS))
+            row_has_food = food_present.any(axis=1)
+            first_col_missing = pd.isna(cells[:, 0])
+            
             # 处理菜单数据
             current_meal_type = "早餐"  # 默认餐次
             category_row_count = 0  # 记录遇到的"类别"行数量
@@ -257,15 +456,15 @@ class ExcelParser:
             item_order = 0  # 菜品顺序计数器
             category_order_map = {}  # 分类名称到顺序的映射
             
-            for row_idx in range(len(df)):
+            for row_idx, (text_row, first_missing) in enumerate(zip(texts, first_col_missing)):
                 if row_idx == weekday_row_idx:
                     continue
                     
                 try:
-                    first_col_value = str(df.iloc[row_idx, 0]).strip()
+                    first_col_value = text_row[0]
                     
                     # 检查是否是餐次标识
-                    if first_col_value in ['早餐', '午餐', '晚餐']:
+                    if first_col_value in _MEAL_MARKERS:
                         current_meal_type = first_col_value
                         explicit_meal_set = True  # 标记为明确设置
                         current_category = None  # 重置分类
@@ -299,7 +498,7 @@ class ExcelParser:
                         if category_row_count > 1:
                             explicit_meal_set = False
                         continue
-                    elif first_col_value in ['NaN', 'nan'] or pd.isna(df.iloc[row_idx, 0]):
+                    elif first_missing or first_col_value in ('NaN', 'nan'):
                         # 第一列为空（NaN），继续使用当前分类，不做任何处理
                         pass
                     elif first_col_value == '':
@@ -320,49 +519,46 @@ class ExcelParser:
                             logger.debug(f"第{row_idx}行第一列看起来像菜品名称，不更新分类: {first_col_value}")
                             pass
                     
-                    # 处理菜品数据
-                    for col_idx, date_str in weekday_to_date.items():
+                    # 本行各星期列都为空时只需更新上面的餐次/分类状态
+                    if not row_has_food[row_idx]:
+                        continue
+                    
+                    # 确定餐次和分类，同一行各日期列共用
+                    meal_type = self._normalize_meal_type(current_meal_type) or 'lunch'
+                    
+                    # 使用当前分类，如果没有则使用第一列的值
+                    category_to_use = current_category
+                    if not category_to_use and first_col_value not in ('NaN', 'nan', ''):
+                        category_to_use = first_col_value
+                    
+                    # 获取分类顺序
+                    cat_order = category_order_map.get(category_to_use, 0)
+                    
+                    # 处理菜品数据，只遍历本行非空的星期列
+                    for col_idx, date_str in compress(date_columns, food_present[row_idx]):
                         try:
-                            food_value = str(df.iloc[row_idx, col_idx]).strip()
+                            # 查找或创建餐次，(日期, 餐次) 直接查缓存
+                            meal = meal_cache.get((date_str, meal_type))
+                            if meal is None:
+                                menu_data = menu_data_dict.get(date_str)
+                                if menu_data is None:
+                                    menu_data = menu_data_dict[date_str] = MenuData(date=date_str)
+                                meal = Meal(type=meal_type, time=self._get_meal_time(meal_type))
+                                menu_data.add_meal(meal)
+                                meal_cache[(date_str, meal_type)] = meal
                             
-                            if food_value and food_value not in ['NaN', 'nan', '<NA>', '']:
-                                # 创建或获取MenuData
-                                if date_str not in menu_data_dict:
-                                    menu_data_dict[date_str] = MenuData(date=date_str)
-                                
-                                menu_data = menu_data_dict[date_str]
-                                
-                                # 确定餐次和时间
-                                meal_type = self._normalize_meal_type(current_meal_type) or 'lunch'
-                                time_str = self._get_meal_time(meal_type)
-                                
-                                # 查找或创建餐次
-                                meal = menu_data.get_meal_by_type(meal_type)
-                                if not meal:
-                                    meal = Meal(type=meal_type, time=time_str)
-                                    menu_data.add_meal(meal)
-                                
-                                # 分割多个菜品（用逗号、顿号等分隔）
-                                foods = re.split(r'[，,、/]', food_value)
-                                for food in foods:
-                                    food = food.strip()
-                                    if food:
-                                        # 使用当前分类，如果没有则使用第一列的值
-                                        category_to_use = current_category
-                                        if not category_to_use and first_col_value not in ['NaN', 'nan', '']:
-                                            category_to_use = first_col_value
-                                        
-                                        # 获取分类顺序
-                                        cat_order = category_order_map.get(category_to_use, 0)
-                                        
-                                        item_order += 1
-                                        menu_item = MenuItem(
-                                            name=food,
-                                            category=category_to_use,
-                                            order=item_order,
-                                            category_order=cat_order
-                                        )
-                                        meal.add_item(menu_item)
+                            # 分割多个菜品（用逗号、顿号等分隔），同一单元格的菜品一次加入餐次
+                            foods = [food for food in map(str.strip, _WEEKLY_FOOD_SEPARATOR_RE.split(text_row[col_idx])) if food]
+                            meal.add_items(
+                                MenuItem(
+                                    name=food,
+                                    category=category_to_use,
+                                    order=item_order + offset,
+                                    category_order=cat_order
+                                )
+                                for offset, food in enumerate(foods, 1)
+                            )
+                            item_order += len(foods)
                         except Exception as e:
                             logger.warning(f"处理第{row_idx}行第{col_idx}列时出错: {e}")
                             continue
@@ -376,9 +572,25 @@ class ExcelParser:
             raise ExcelParsingError("No valid menu data found in weekly format")
         
         logger.info(f"成功解析weekly格式，生成{len(result)}天菜单")
-        return sorted(result, key=lambda x: x.date)
+        return sorted(result, key=attrgetter('date'))
+    
+    @staticmethod
+    def _weekly_header_mask(cells: np.ndarray) -> np.ndarray:
+        """
+        Mark the cells where the weekly format looks for its weekday headers.
+        
+        Args:
+            cells: Cell values of the sheet as a 2D object array
+            
+        Returns:
+            Boolean mask over the first 10 rows, first column excluded, of
+            the cells whose text contains 星期
+        """
+        return np.char.find(_cell_texts(cells[:10, 1:]).astype(str), '星期') >= 0
     
-    def _parse_horizontal_weekly_format(self, df: pd.DataFrame) -> List[MenuData]:
+    def _parse_horizontal_weekly_format(self, df: pd.DataFrame, filename: str = '',
+                                        weekday_headers: Optional[Tuple[Optional[int], Dict[int, Tuple[str, int]]]] = None
+                                        ) -> List[MenuData]:
         """
         Parse horizontal weekly format where weekdays are columns and categories are rows.
         Enhanced version with multi-meal support.
@@ -391,44 +603,61 @@ class ExcelParser:
         
         Args:
             df: DataFrame with horizontal weekly structure
+            filename: Name of the source file, used to read the menu's date range
+            weekday_headers: Result of _find_weekday_headers if the caller already has it
             
         Returns:
             List of MenuData objects
         """
         logger.info("尝试解析横向weekly格式（支持多餐次）")
         
+        # 星期标题行和基准日期只确定一次，多餐次解析和单餐次回退共用
+        weekday_row_idx, weekday_cols = weekday_headers or self._find_weekday_headers(df)
+        if not weekday_cols:
+            raise ExcelParsingError("Could not find weekday headers in horizontal format")
+        
+        base_date = self._extract_base_date_from_df(df, filename)
+        if not base_date:
+            raise ExcelParsingError("Could not determine base date for horizontal weekly format")
+        
         try:
-            return self._parse_horizontal_weekly_format_multi_meal(df)
+            return self._parse_horizontal_weekly_format_multi_meal(df, weekday_row_idx, weekday_cols, base_date)
         except Exception as e:
             logger.warning(f"多餐次解析失败，回退到原始方法: {e}")
-            return self._parse_horizontal_weekly_format_single_meal(df)
+            return self._parse_horizontal_weekly_format_single_meal(df, weekday_row_idx, weekday_cols, base_date)
     
-    def _parse_horizontal_weekly_format_multi_meal(self, df: pd.DataFrame) -> List[MenuData]:
+    def _parse_horizontal_weekly_format_multi_meal(self, df: pd.DataFrame, weekday_row_idx: int,
+                                                   weekday_cols: Dict[int, Tuple[str, int]],
+                                                   base_date: date) -> List[MenuData]:
         """
         增强的横向格式解析器，支持多餐次识别
+        
+        Args:
+            df: DataFrame with horizontal weekly structure
+            weekday_row_idx: 星期标题行的索引
+            weekday_cols: {列索引: (星期名, 星期数)}，由 _find_weekday_headers 得到
+            base_date: 菜单的基准日期，由 _extract_base_date_from_df 得到
+            
+        Returns:
+            List of MenuData objects
         """
         logger.info("使用多餐次解析器")
         
-        # 1. 找到星期标题行
-        weekday_row_idx, weekday_cols = self._find_weekday_headers(df)
-        if not weekday_cols:
-            raise ExcelParsingError("Could not find weekday headers in horizontal format")
+        # 单元格文本和非空标记整表只计算一次，分段识别和各星期列的菜品提取共用
+        values = df.to_numpy(dtype=object)
+        texts = _cell_texts(values)
+        present = pd.notna(values)
         
-        # 2. 识别餐次分段
+        # 1. 识别餐次分段
         from .meal_segment_identifier import MealSegmentIdentifier
         segment_identifier = MealSegmentIdentifier()
-        meal_segments = segment_identifier.identify_meal_segments(df, weekday_row_idx)
+        meal_segments = segment_identifier.identify_meal_segments(df, weekday_row_idx, texts)
         
         logger.info(f"识别到 {len(meal_segments)} 个餐次分段")
         for i, segment in enumerate(meal_segments):
             logger.info(f"分段{i+1}: {segment.meal_type}, 行{segment.start_row}-{segment.end_row}")
         
-        # 3. 提取基准日期
-        base_date = self._extract_base_date_from_df(df)
-        if not base_date:
-            raise ExcelParsingError("Could not determine base date for horizontal weekly format")
-        
-        # 4. 为每个星期和每个餐次解析菜单数据
+        # 2. 为每个星期和每个餐次解析菜单数据
         result = []
         
         for col_idx, (weekday_name, weekday_num) in weekday_cols.items():
@@ -437,25 +666,19 @@ class ExcelParser:
             
             # 为每个餐次分段创建Meal对象
             for segment in meal_segments:
-                items = self._extract_items_from_segment(df, segment, col_idx)
+                items = self._extract_items_from_segment(texts, present, segment, col_idx)
                 
                 if items:  # 只有当有菜品时才创建餐次
-                    meal_times = {
-                        'breakfast': '07:30',
-                        'lunch': '12:00',
-                        'dinner': '18:00'
-                    }
-                    
                     meal = Meal(
                         type=segment.meal_type,
-                        time=meal_times.get(segment.meal_type, '12:00'),
+                        time=self._get_meal_time(segment.meal_type),
                         items=items
                     )
                     meals.append(meal)
             
             if meals:
                 menu_data = MenuData(
-                    date=menu_date.strftime('%Y-%m-%d'),
+                    date=menu_date.isoformat(),
                     meals=meals
                 )
                 result.append(menu_data)
@@ -465,7 +688,7 @@ class ExcelParser:
             raise ExcelParsingError("No valid menu data found in horizontal weekly format")
         
         logger.info(f"成功解析横向weekly格式，生成{len(result)}天菜单")
-        return sorted(result, key=lambda x: x.date)
+        return sorted(result, key=attrgetter('date'))
     
     def _find_weekday_headers(self, df: pd.DataFrame) -> Tuple[Optional[int], Dict[int, Tuple[str, int]]]:
         """
@@ -474,47 +697,31 @@ class ExcelParser:
         Returns:
             Tuple[Optional[int], Dict[int, Tuple[str, int]]]: (行索引, {列索引: (星期名, 星期数)})
         """
-        weekday_row_idx = None
+        # 只扫描前5行：每种写法对这几行的全部单元格做一次子串查找，得到 写法×行×列 的命中矩阵
+        head = _cell_texts(df.iloc[:5].to_numpy(dtype=object)).astype(str)
+        weekday_names = list(_WEEKDAY_NUMBERS)
+        hits = np.stack([np.char.find(head, weekday_name) >= 0 for weekday_name in weekday_names])
+        
+        hit_rows = np.flatnonzero(hits.any(axis=(0, 2)))
+        if not hit_rows.size:
+            return None, {}
+        
+        # 第一个命中的行即星期标题行，每列取字典顺序中第一个出现的写法
+        weekday_row_idx = int(hit_rows[0])
+        row_hits = hits[:, weekday_row_idx, :]
+        first_match = row_hits.argmax(axis=0)
         weekday_cols = {}
-        
-        for row_idx in range(min(5, len(df))):
-            row_data = df.iloc[row_idx].astype(str)
-            weekday_found = False
-            
-            for col_idx, cell_value in enumerate(row_data):
-                if pd.isna(cell_value) or cell_value.strip() == 'nan':
-                    continue
-                    
-                cell_value = str(cell_value).strip()
-                
-                # Check for weekday patterns
-                weekdays = {
-                    '星期天': 6, '星期日': 6, '周日': 6, '日': 6,
-                    '星期一': 0, '周一': 0, '一': 0,
-                    '星期二': 1, '周二': 1, '二': 1,
-                    '星期三': 2, '周三': 2, '三': 2,
-                    '星期四': 3, '周四': 3, '四': 3,
-                    '星期五': 4, '周五': 4, '五': 4,
-                    '星期六': 5, '周六': 5, '六': 5,
-                }
-                
-                for weekday_name, weekday_num in weekdays.items():
-                    if weekday_name in cell_value:
-                        weekday_row_idx = row_idx
-                        weekday_cols[col_idx] = (weekday_name, weekday_num)
-                        weekday_found = True
-                        break
-            
-            if weekday_found:
-                break
+        for col_idx in np.flatnonzero(row_hits.any(axis=0)):
+            weekday_name = weekday_names[first_match[col_idx]]
+            weekday_cols[int(col_idx)] = (weekday_name, _WEEKDAY_NUMBERS[weekday_name])
         
         return weekday_row_idx, weekday_cols
     
-    def _extract_base_date_from_df(self, df: pd.DataFrame) -> Optional[date]:
-        """从DataFrame中提取基准日期"""
+    def _extract_base_date_from_df(self, df: pd.DataFrame, filename: str = '') -> Optional[date]:
+        """从文件名或DataFrame中提取基准日期"""
         # Try to extract from filename first
-        if hasattr(self, '_current_filename'):
-            base_date = self._extract_date_from_filename_string(self._current_filename)
+        if filename:
+            base_date = self._extract_date_from_filename_string(filename)
             if base_date:
                 return base_date
         
@@ -527,241 +734,102 @@ class ExcelParser:
         
         return None
     
-    def _extract_items_from_segment(self, df: pd.DataFrame, segment, col_idx: int) -> List[MenuItem]:
-        """从餐次分段中提取菜品"""
+    def _extract_items_from_segment(self, texts: np.ndarray, present: np.ndarray,
+                                    segment, col_idx: int) -> List[MenuItem]:
+        """
+        从餐次分段中提取菜品
+        
+        Args:
+            texts: 整表的单元格文本网格（去除首尾空白）
+            present: 与 texts 对应的非空单元格标记
+            segment: 餐次分段
+            col_idx: 星期所在列
+            
+        Returns:
+            该星期在此分段中的菜品列表
+        """
         items = []
         current_category = None
         item_order = 0
         category_order = 0
         category_order_map = {}
         
-        for row_idx in range(segment.start_row, segment.end_row + 1):
+        if col_idx >= texts.shape[1]:
+            return items
+        
+        # 清洗后的空单元格都是缺失值（'nan'文本已转为 pd.NA），按非空标记判断，不再逐格比较 'nan'
+        row_slice = slice(segment.start_row, segment.end_row + 1)
+        
+        for category_cell, has_category, food_items, has_food in zip(
+            texts[row_slice, 0], present[row_slice, 0], texts[row_slice, col_idx], present[row_slice, col_idx]
+        ):
             # 检查第一列是否是分类
-            category_cell = str(df.iloc[row_idx, 0]).strip()
-            if category_cell and category_cell != 'nan' and not pd.isna(df.iloc[row_idx, 0]):
-                if category_cell not in ['类别', '早餐', '午餐', '晚餐']:
+            if has_category:
+                if category_cell and category_cell != '类别' and category_cell not in _MEAL_MARKERS:
                     current_category = category_cell
                     if current_category not in category_order_map:
                         category_order_map[current_category] = category_order
                         category_order += 1
             
             # 获取该星期的菜品
-            if col_idx < len(df.columns):
-                food_cell = df.iloc[row_idx, col_idx]
-                if pd.isna(food_cell) or str(food_cell).strip() in ['', 'nan']:
-                    continue
-                
-                food_items = str(food_cell).strip()
-                if food_items:
-                    # 分割多个菜品
-                    item_list = re.split(r'[,，、；;]', food_items)
-                    for item_name in item_list:
-                        item_name = item_name.strip()
-                        if item_name and item_name != 'nan':
-                            items.append(MenuItem(
-                                name=item_name,
-                                category=current_category or '其他',
-                                description=None,
-                                price=None,
-                                order=item_order,
-                                category_order=category_order_map.get(current_category, 0)
-                            ))
-                            item_order += 1
+            if not has_food:
+                continue
+            
+            if food_items:
+                # 分割多个菜品
+                for item_name in _ITEM_SEPARATOR_RE.split(food_items):
+                    item_name = item_name.strip()
+                    if item_name and item_name != 'nan':
+                        items.append(MenuItem(
+                            name=item_name,
+                            category=current_category or '其他',
+                            description=None,
+                            price=None,
+                            order=item_order,
+                            category_order=category_order_map.get(current_category, 0)
+                        ))
+                        item_order += 1
         
         return items
     
-    def _parse_horizontal_weekly_format_single_meal(self, df: pd.DataFrame) -> List[MenuData]:
+    def _parse_horizontal_weekly_format_single_meal(self, df: pd.DataFrame, weekday_row_idx: int,
+                                                    weekday_cols: Dict[int, Tuple[str, int]],
+                                                    base_date: date) -> List[MenuData]:
         """
         原始的单餐次解析方法（作为回退）
-        """
-        logger.info("使用单餐次回退解析器")
         
-        # Find the row with weekday headers
-        weekday_row_idx = None
-        weekday_cols = {}
-        
-        for row_idx in range(min(5, len(df))):
-            row_data = df.iloc[row_idx].astype(str)
-            weekday_found = False
-            
-            for col_idx, cell_value in enumerate(row_data):
-                if pd.isna(cell_value) or cell_value.strip() == 'nan':
-                    continue
-                    
-                cell_value = str(cell_value).strip()
-                
-                # Check for weekday patterns
-                weekdays = {
-                    '星期天': 6, '星期日': 6, '周日': 6, '日': 6,
-                    '星期一': 0, '周一': 0, '一': 0,
-                    '星期二': 1, '周二': 1, '二': 1,
-                    '星期三': 2, '周三': 2, '三': 2,
-                    '星期四': 3, '周四': 3, '四': 3,
-                    '星期五': 4, '周五': 4, '五': 4,
-                    '星期六': 5, '周六': 5, '六': 5,
-                }
-                
-                for weekday_name, weekday_num in weekdays.items():
-                    if weekday_name in cell_value:
-                        weekday_row_idx = row_idx
-                        weekday_cols[col_idx] = (weekday_name, weekday_num)
-                        weekday_found = True
-                        break
+        Args:
+            df: DataFrame with horizontal weekly structure
+            weekday_row_idx: 星期标题行的索引
+            weekday_cols: {列索引: (星期名, 星期数)}，由 _find_weekday_headers 得到
+            base_date: 菜单的基准日期，由 _extract_base_date_from_df 得到
             
-            if weekday_found:
-                break
-        
-        if not weekday_cols:
-            raise ExcelParsingError("Could not find weekday headers in horizontal format")
+        Returns:
+            List of MenuData objects
+        """
+        logger.info("使用单餐次回退解析器")
         
         logger.info(f"找到星期标题行: {weekday_row_idx}, 列映射: {weekday_cols}")
         
-        # Find meal type (should be in a row before weekday headers)
-        meal_type = 'lunch'  # default
-        for row_idx in range(max(0, weekday_row_idx - 2), weekday_row_idx):
-            for col_idx in range(len(df.columns)):
-                cell_value = str(df.iloc[row_idx, col_idx]).strip()
-                if cell_value in ['早餐', 'breakfast']:
-                    meal_type = 'breakfast'
-                elif cell_value in ['午餐', '中餐', 'lunch']:
-                    meal_type = 'lunch'
-                elif cell_value in ['晚餐', 'dinner']:
-                    meal_type = 'dinner'
-        
-        # Extract date range from filename or title
-        base_date = self._extract_base_date_from_df(df)
-        if not base_date:
-            raise ExcelParsingError("Could not determine base date for horizontal weekly format")
-        
-        # Parse menu data for each weekday
-        result = []
-        
-        for col_idx, (weekday_name, weekday_num) in weekday_cols.items():
-            # Calculate the actual date for this weekday
-            menu_date = self._calculate_date_for_weekday(base_date, weekday_num)
-            
-            # Extract food items for this day
-            items = []
-            current_category = None
-            
-            # Start from the row after weekday headers
-            for row_idx in range(weekday_row_idx + 1, len(df)):
-                # Check first column for category
-                category_cell = str(df.iloc[row_idx, 0]).strip()
-                if category_cell and category_cell != 'nan' and not pd.isna(df.iloc[row_idx, 0]):
-                    current_category = category_cell
-                
-                # Get food item for this day
-                if col_idx < len(df.columns):
-                    food_cell = df.iloc[row_idx, col_idx]
-                    if pd.isna(food_cell) or str(food_cell).strip() in ['', 'nan']:
-                        continue
-                    
-                    food_items = str(food_cell).strip()
-                    if food_items:
-                        # Split multiple items (separated by comma, 、, or other delimiters)
-                        item_list = re.split(r'[,，、；;]', food_items)
-                        for item_name in item_list:
-                            item_name = item_name.strip()
-                            if item_name and item_name != 'nan':
-                                items.append(MenuItem(
-                                    name=item_name,
-                                    category=current_category or '其他',
-                                    description=None,
-                                    price=None
-                                ))
-            
-            if items:
-                # Create meal with default time based on meal type
-                meal_times = {
-                    'breakfast': '07:30',
-                    'lunch': '12:00',
-                    'dinner': '18:00'
-                }
-                
-                meal = Meal(
-                    type=meal_type,
-                    time=meal_times.get(meal_type, '12:00'),
-                    items=items
-                )
-                
-                menu_data = MenuData(
-                    date=menu_date.strftime('%Y-%m-%d'),
-                    meals=[meal]
-                )
-                
-                result.append(menu_data)
-                logger.info(f"解析{weekday_name}({menu_date})菜单，共{len(items)}道菜")
-        
-        if not result:
-            raise ExcelParsingError("No valid menu data found in horizontal weekly format")
-        
-        logger.info(f"成功解析横向weekly格式（单餐次），生成{len(result)}天菜单")
-        return sorted(result, key=lambda x: x.date)
-        weekday_cols = {}
-        
-        for row_idx in range(min(5, len(df))):
-            row_data = df.iloc[row_idx].astype(str)
-            weekday_found = False
-            
-            for col_idx, cell_value in enumerate(row_data):
-                if pd.isna(cell_value) or cell_value.strip() == 'nan':
-                    continue
-                    
-                cell_value = str(cell_value).strip()
-                
-                # Check for weekday patterns
-                weekdays = {
-                    '星期天': 6, '星期日': 6, '周日': 6, '日': 6,
-                    '星期一': 0, '周一': 0, '一': 0,
-                    '星期二': 1, '周二': 1, '二': 1,
-                    '星期三': 2, '周三': 2, '三': 2,
-                    '星期四': 3, '周四': 3, '四': 3,
-                    '星期五': 4, '周五': 4, '五': 4,
-                    '星期六': 5, '周六': 5, '六': 5,
-                }
-                
-                for weekday_name, weekday_num in weekdays.items():
-                    if weekday_name in cell_value:
-                        weekday_row_idx = row_idx
-                        weekday_cols[col_idx] = (weekday_name, weekday_num)
-                        weekday_found = True
-                        break
-            
-            if weekday_found:
-                break
-        
-        if not weekday_cols:
-            raise ExcelParsingError("Could not find weekday headers in horizontal format")
-        
-        logger.info(f"找到星期标题行: {weekday_row_idx}, 列映射: {weekday_cols}")
+        # 单元格文本和"有内容"标记整表一次算出：非缺失值，且文本不是空串或 'nan'
+        cells = df.to_numpy(dtype=object)
+        texts = _cell_texts(cells)
+        filled = pd.notna(cells) & (texts != '') & (texts != 'nan')
         
         # Find meal type (should be in a row before weekday headers)
         meal_type = 'lunch'  # default
         for row_idx in range(max(0, weekday_row_idx - 2), weekday_row_idx):
             for col_idx in range(len(df.columns)):
-                cell_value = str(df.iloc[row_idx, col_idx]).strip()
-                if cell_value in ['早餐', 'breakfast']:
-                    meal_type = 'breakfast'
-                elif cell_value in ['午餐', '中餐', 'lunch']:
-                    meal_type = 'lunch'
-                elif cell_value in ['晚餐', 'dinner']:
-                    meal_type = 'dinner'
+                meal_type = _HEADER_MEAL_TYPES.get(texts[row_idx, col_idx], meal_type)
         
-        # Extract date range from filename or title
-        base_date = None
-        
-        # Try to extract from filename
-        if hasattr(self, '_current_filename'):
-            base_date = self._extract_date_from_filename_string(self._current_filename)
-        
-        if not base_date:
-            # Try to extract from title row
-            title_row = df.iloc[0, 0] if len(df) > 0 else ""
-            base_date = self._extract_date_from_title(str(title_row))
-        
-        if not base_date:
-            raise ExcelParsingError("Could not determine base date for horizontal weekly format")
+        # 星期标题行之后的数据区；第一列有内容的行开始一个新分类并向下延续，
+        # 每行所属分类整列一次算出，各星期列共用（第一个分类之前的行归入“其他”）
+        body_texts = texts[weekday_row_idx + 1:]
+        body_filled = filled[weekday_row_idx + 1:]
+        category_rows = np.maximum.accumulate(
+            np.where(body_filled[:, 0], np.arange(len(body_texts)), -1)
+        )
+        row_categories = np.where(category_rows >= 0, body_texts[np.maximum(category_rows, 0), 0], '其他')
         
         # Parse menu data for each weekday
         result = []
@@ -772,51 +840,32 @@ class ExcelParser:
             
             # Extract food items for this day
             items = []
-            current_category = None
             
-            # Start from the row after weekday headers
-            for row_idx in range(weekday_row_idx + 1, len(df)):
-                # Check first column for category
-                category_cell = str(df.iloc[row_idx, 0]).strip()
-                if category_cell and category_cell != 'nan' and not pd.isna(df.iloc[row_idx, 0]):
-                    current_category = category_cell
-                
-                # Get food item for this day
-                if col_idx < len(df.columns):
-                    food_cell = df.iloc[row_idx, col_idx]
-                    if pd.isna(food_cell) or str(food_cell).strip() in ['', 'nan']:
-                        continue
-                    
-                    food_items = str(food_cell).strip()
-                    if food_items:
-                        # Split multiple items (separated by comma, 、, or other delimiters)
-                        item_list = re.split(r'[,，、；;]', food_items)
-                        for item_name in item_list:
-                            item_name = item_name.strip()
-                            if item_name and item_name != 'nan':
-                                items.append(MenuItem(
-                                    name=item_name,
-                                    category=current_category or '其他',
-                                    description=None,
-                                    price=None
-                                ))
+            # 只遍历该星期列中有内容的行
+            if col_idx < len(df.columns):
+                for row_idx in np.flatnonzero(body_filled[:, col_idx]):
+                    # Split multiple items (separated by comma, 、, or other delimiters)
+                    item_list = _ITEM_SEPARATOR_RE.split(body_texts[row_idx, col_idx])
+                    for item_name in item_list:
+                        item_name = item_name.strip()
+                        if item_name and item_name != 'nan':
+                            items.append(MenuItem(
+                                name=item_name,
+                                category=row_categories[row_idx],
+                                description=None,
+                                price=None
+                            ))
             
             if items:
                 # Create meal with default time based on meal type
-                meal_times = {
-                    'breakfast': '07:30',
-                    'lunch': '12:00',
-                    'dinner': '18:00'
-                }
-                
                 meal = Meal(
                     type=meal_type,
-                    time=meal_times.get(meal_type, '12:00'),
+                    time=self._get_meal_time(meal_type),
                     items=items
                 )
                 
                 menu_data = MenuData(
-                    date=menu_date.strftime('%Y-%m-%d'),  # 转换为字符串格式
+                    date=menu_date.isoformat(),
                     meals=[meal]
                 )
                 
@@ -826,15 +875,14 @@ class ExcelParser:
         if not result:
             raise ExcelParsingError("No valid menu data found in horizontal weekly format")
         
-        logger.info(f"成功解析横向weekly格式，生成{len(result)}天菜单")
-        return sorted(result, key=lambda x: x.date)
+        logger.info(f"成功解析横向weekly格式（单餐次），生成{len(result)}天菜单")
+        return sorted(result, key=attrgetter('date'))
     
     def _extract_date_from_title(self, title: str) -> Optional[date]:
         """Extract date from title string like '食堂菜单（1月4-9日）'"""
         try:
             # Pattern for Chinese date format like "1月4-9日" or "1月4日-9日"
-            pattern = r'(\d+)月(\d+)[-–]?(\d*)日?'
-            match = re.search(pattern, title)
+            match = _TITLE_DATE_RE.search(title)
             if match:
                 month = int(match.group(1))
                 start_day = int(match.group(2))
@@ -852,8 +900,7 @@ class ExcelParser:
         try:
             # 优先尝试包含年份的完整格式
             # 格式1: "2025年12月15-19" 或 "2026年1月4日-9日"
-            year_pattern = r'(\d{4})年(\d{1,2})月(\d{1,2})日?[-–](\d{1,2})日?'
-            match = re.search(year_pattern, filename)
+            match = _FILENAME_YEAR_RANGE_RE.search(filename)
             if match:
                 year = int(match.group(1))
                 month = int(match.group(2))
@@ -863,8 +910,7 @@ class ExcelParser:
             
             # 回退到只有月日的格式（使用智能年份推断）
             # 格式2: "1月4日-9日" 或 "1月4-9日"
-            month_pattern = r'(\d{1,2})月(\d{1,2})日?[-–](\d{1,2})日?'
-            match = re.search(month_pattern, filename)
+            match = _FILENAME_MONTH_RANGE_RE.search(filename)
             if match:
                 month = int(match.group(1))
                 start_day = int(match.group(2))
@@ -916,27 +962,17 @@ class ExcelParser:
         Returns:
             The calculated date
         """
-        from datetime import timedelta
-        
-        # Get the weekday of the base date (0=Monday, 6=Sunday)
-        base_weekday = base_date.weekday()
-        
-        # Calculate the difference in days
-        days_diff = target_weekday - base_weekday
-        
-        # If the target weekday is before the base weekday in the same week,
-        # it might be in the next week
-        if days_diff < 0:
-            days_diff += 7
-        
-        return base_date + timedelta(days=days_diff)
+        # 目标星期早于基准日期的星期时落在下一周，取模后得到 0-6 天的偏移，
+        # 直接在序数上相加，不构造 timedelta
+        return date.fromordinal(base_date.toordinal() + (target_weekday - base_date.weekday()) % 7)
     
-    def _parse_standard_format(self, df: pd.DataFrame) -> List[MenuData]:
+    def _parse_standard_format(self, df: pd.DataFrame, filename: str = '') -> List[MenuData]:
         """
         Parse standard column-based format.
         
         Args:
             df: DataFrame with standard column structure
+            filename: Name of the source file, used to read the menu's date range
             
         Returns:
             List of MenuData objects
@@ -950,57 +986,62 @@ class ExcelParser:
         # 检查是否是weekly格式
         if column_mapping.get('format') == 'weekly':
             logger.info("使用weekly格式解析")
-            return self._parse_weekly_format(df)
-        
-        # Extract data using the identified column mapping
+            return self._parse_weekly_format(df, filename)
+        
+        # 整行为空的行不参与解析
+        df = df.dropna(how='all')
+        
+        # 每列先转换为单元格文本，各取值只解析一次再按编码展开，不逐行调用解析函数
+        records = pd.DataFrame({
+            'date': self._parse_date_column(df[column_mapping['date']]),
+            'meal_type': self._map_distinct(
+                df[column_mapping['meal_type']], self._normalize_meal_type
+            ).fillna('lunch') if 'meal_type' in column_mapping else 'lunch',
+            'time': self._map_distinct(
+                df[column_mapping['time']], self._parse_meal_time
+            ).fillna('12:00') if 'time' in column_mapping else '12:00',
+            'food_name': self._map_distinct(df[column_mapping['food_name']], self._clean_text_value),
+            'description': self._map_distinct(
+                df[column_mapping['description']], self._clean_text_value
+            ) if 'description' in column_mapping else None,
+            'category': self._map_distinct(
+                df[column_mapping['category']], self._clean_text_value
+            ) if 'category' in column_mapping else None,
+        }, index=df.index)
+        records = records[records['date'].notna() & records['food_name'].notna()]
+        
+        # 每个 (日期, 餐次) 分组只创建一次Meal，菜品按行顺序一次性放入；
+        # 分组只取行位置，按位置直接索引各列数组，不为每组切出子DataFrame
+        times, food_names, descriptions, categories = (
+            records[key].to_numpy() for key in ('time', 'food_name', 'description', 'category')
+        )
+        groups = records.groupby(['date', 'meal_type'], sort=False).indices
+        
+        # 餐次时间取组内第一个能通过校验的时间，在它之前的行没有可归属的餐次；
+        # 各组按该行的位置排序，与逐行解析时餐次的创建顺序一致
         menu_data_dict = {}  # date -> MenuData
-        
-        for index, row in df.iterrows():
-            try:
-                # Skip empty rows
-                if row.isna().all():
-                    continue
-                
-                # Extract date
-                try:
-                    date_str = self._extract_date(row, column_mapping)
-                    if not date_str:
-                        continue
-                except Exception as e:
-                    logger.warning(f"Error extracting date from row {index}: {e}, column_mapping: {column_mapping}, row: {row.to_dict()}")
-                    continue
-                
-                # Extract meal information
-                meal_type = self._extract_meal_type(row, column_mapping)
-                meal_time = self._extract_meal_time(row, column_mapping)
-                food_name = self._extract_food_name(row, column_mapping)
-                
-                if not food_name:
-                    continue
-                
-                # Create MenuItem
-                menu_item = MenuItem(
-                    name=food_name,
-                    description=self._extract_description(row, column_mapping),
-                    category=self._extract_category(row, column_mapping)
-                )
-                
-                # Ensure MenuData exists for this date
-                if date_str not in menu_data_dict:
-                    menu_data_dict[date_str] = MenuData(date=date_str)
-                
-                # Find or create meal
-                meal = menu_data_dict[date_str].get_meal_by_type(meal_type)
-                if not meal:
-                    meal = Meal(type=meal_type, time=meal_time)
-                    menu_data_dict[date_str].add_meal(meal)
-                
-                # Add item to meal
-                meal.add_item(menu_item)
-                
-            except Exception as e:
-                logger.warning(f"Error processing row {index}: {e}")
-                continue
+        meal_rows = []
+        for (date_str, meal_type), positions in groups.items():
+            if date_str not in menu_data_dict:
+                menu_data_dict[date_str] = MenuData(date=date_str)
+            
+            start = next(
+                (i for i, pos in enumerate(positions) if Meal(type=meal_type, time=times[pos]).validate()),
+                None
+            )
+            if start is not None:
+                meal_rows.append((positions[start], date_str, meal_type, positions[start:]))
+        meal_rows.sort(key=itemgetter(0))
+        
+        for _, date_str, meal_type, positions in meal_rows:
+            menu_data_dict[date_str].add_meal(Meal(
+                type=meal_type,
+                time=times[positions[0]],
+                items=[
+                    MenuItem(name=food_names[pos], description=descriptions[pos], category=categories[pos])
+                    for pos in positions
+                ]
+            ))
         
         # Convert to list and validate
         result = []
@@ -1013,23 +1054,17 @@ class ExcelParser:
         if not result:
             raise ExcelParsingError("No valid menu data found in Excel file")
         
-        return sorted(result, key=lambda x: x.date)
+        return sorted(result, key=attrgetter('date'))
     
-    def _get_meal_time(self, meal_type: str) -> str:
+    @staticmethod
+    def _get_meal_time(meal_type: str) -> str:
         """Get default time for meal type."""
-        time_map = {
-            'breakfast': '07:30',
-            'lunch': '12:00',
-            'dinner': '18:00'
-        }
-        return time_map.get(meal_type, '12:00')
+        return _DEFAULT_MEAL_TIMES.get(meal_type, '12:00')
     
     def _split_food_items(self, food_items: str) -> List[str]:
         """Split food items string into individual items."""
-        import re
         # Split by common separators
-        items = re.split(r'[,，、/\\|]', food_items)
-        return [item.strip() for item in items if item.strip()]
+        return [item for item in map(str.strip, _FOOD_SEPARATOR_RE.split(food_items)) if item]
     
     def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -1041,14 +1076,15 @@ class ExcelParser:
         Returns:
             Cleaned DataFrame
         """
-        # Remove completely empty rows and columns
-        df = df.dropna(how='all').dropna(axis=1, how='all')
+        # Remove completely empty rows and columns with one missing-value mask and a single copy;
+        # 被删除的行全为空，不影响列是否全为空的判断
+        empty = df.isna().to_numpy()
+        df = df.loc[~empty.all(axis=1), ~empty.all(axis=0)]
         
-        # Strip whitespace from string columns
-        for col in df.columns:
-            if df[col].dtype == 'object':
-                df[col] = df[col].astype(str).str.strip()
-                df[col] = df[col].replace('nan', pd.NA)
+        # Strip whitespace from string columns in one pass over the object block
+        object_columns = df.columns[(df.dtypes == object).to_numpy()]
+        if len(object_columns):
+            df[object_columns] = _clean_cells(df[object_columns].to_numpy())
         
         return df
     
@@ -1067,35 +1103,14 @@ class ExcelParser:
         # Convert column names to strings and make them lowercase for comparison
         columns = [str(col).lower().strip() for col in df.columns]
         
-        # Try to identify columns by name patterns
-        for i, col_name in enumerate(columns):
-            original_col = df.columns[i]
-            
-            # Date column patterns
-            if any(pattern in col_name for pattern in ['date', '日期', '时间', 'time']):
-                if 'date' not in column_mapping:
-                    column_mapping['date'] = original_col
-            
-            # Meal type patterns
-            elif any(pattern in col_name for pattern in ['meal', 'type', '餐次', '类型']):
-                column_mapping['meal_type'] = original_col
-            
-            # Time patterns
-            elif any(pattern in col_name for pattern in ['time', '时间', 'hour']):
-                if 'time' not in column_mapping:
-                    column_mapping['time'] = original_col
-            
-            # Food name patterns
-            elif any(pattern in col_name for pattern in ['food', 'name', '菜名', '食物', 'dish']):
-                column_mapping['food_name'] = original_col
-            
-            # Description patterns
-            elif any(pattern in col_name for pattern in ['desc', '描述', '说明', 'detail']):
-                column_mapping['description'] = original_col
-            
-            # Category patterns
-            elif any(pattern in col_name for pattern in ['category', '类别', '分类', 'cat']):
-                column_mapping['category'] = original_col
+        # Try to identify columns by name patterns, in COLUMN_NAME_PATTERNS order
+        for original_col, col_name in zip(df.columns, columns):
+            for column_type, pattern in self.COLUMN_NAME_PATTERNS:
+                if pattern.search(col_name):
+                    # 日期和时间列取第一个命中的列，其余类型取最后一个
+                    if column_type not in _FIRST_MATCH_COLUMN_TYPES or column_type not in column_mapping:
+                        column_mapping[column_type] = original_col
+                    break
         
         # If we couldn't identify by column names, try to infer from data
         if 'date' not in column_mapping or 'food_name' not in column_mapping:
@@ -1131,66 +1146,60 @@ class ExcelParser:
         column_mapping = {}
         
         for col in df.columns:
-            sample_values = df[col].dropna().head(10)
-            
-            if sample_values.empty:
-                continue
-            
-            # Check if this looks like a date column
-            if self._looks_like_date_column(sample_values):
-                if 'date' not in column_mapping:
-                    column_mapping['date'] = col
-            
-            # Check if this looks like a meal type column
-            elif self._looks_like_meal_type_column(sample_values):
-                column_mapping['meal_type'] = col
+            column_type = self._classify_column(df[col].dropna().head(10))
             
-            # Check if this looks like a time column
-            elif self._looks_like_time_column(sample_values):
-                column_mapping['time'] = col
-            
-            # Check if this looks like a food name column (usually has longer text)
-            elif self._looks_like_food_name_column(sample_values):
-                if 'food_name' not in column_mapping:
-                    column_mapping['food_name'] = col
+            # 日期和菜品名称列只取第一个匹配的列
+            if column_type in ('date', 'food_name'):
+                column_mapping.setdefault(column_type, col)
+            elif column_type is not None:
+                column_mapping[column_type] = col
         
         return column_mapping
     
-    def _looks_like_date_column(self, values: pd.Series) -> bool:
+    def _classify_column(self, values: pd.Series) -> Optional[str]:
+        """
+        Classify a column from a sample of its non-null values.
+        
+        The sample is converted to text once and the detectors run in
+        priority order (date, meal type, time, food name), each returning
+        on its first matching value.
+        
+        Args:
+            values: Non-null sample values of the column
+            
+        Returns:
+            'date', 'meal_type', 'time', 'food_name' or None if no type matches
+        """
+        texts = values.astype(str).tolist()
+        if not texts:
+            return None
+        
+        if self._looks_like_date_column(texts):
+            return 'date'
+        if self._looks_like_meal_type_column(texts):
+            return 'meal_type'
+        if self._looks_like_time_column(texts):
+            return 'time'
+        if self._looks_like_food_name_column(texts):
+            return 'food_name'
+        return None
+    
+    def _looks_like_date_column(self, values: Iterable[str]) -> bool:
         """Check if values look like dates."""
-        for value in values:
-            if pd.isna(value):
-                continue
-            if self._parse_date(str(value)):
-                return True
-        return False
+        # 先用正则排除纯文本，避免对每个菜名都走一遍strptime和pd.to_datetime回退
+        return any(_DIGIT_RE.search(value) and self._parse_date(value) for value in values)
     
-    def _looks_like_meal_type_column(self, values: pd.Series) -> bool:
+    def _looks_like_meal_type_column(self, values: Iterable[str]) -> bool:
         """Check if values look like meal types."""
-        for value in values:
-            if pd.isna(value):
-                continue
-            if self._normalize_meal_type(str(value)):
-                return True
-        return False
+        return any(self._normalize_meal_type(value) for value in values)
     
-    def _looks_like_time_column(self, values: pd.Series) -> bool:
+    def _looks_like_time_column(self, values: Iterable[str]) -> bool:
         """Check if values look like times."""
-        time_pattern = re.compile(r'^\d{1,2}:\d{2}')
-        for value in values:
-            if pd.isna(value):
-                continue
-            if time_pattern.match(str(value)):
-                return True
-        return False
+        return any(_TIME_PREFIX_RE.match(value) for value in values)
     
-    def _looks_like_food_name_column(self, values: pd.Series) -> bool:
+    def _looks_like_food_name_column(self, values: Iterable[str]) -> bool:
         """Check if values look like food names (longer text, varied content)."""
-        text_lengths = []
-        for value in values:
-            if pd.isna(value):
-                continue
-            text_lengths.append(len(str(value)))
+        text_lengths = [len(value) for value in values]
         
         if not text_lengths:
             return False
@@ -1199,21 +1208,16 @@ class ExcelParser:
         avg_length = sum(text_lengths) / len(text_lengths)
         return avg_length > 2 and len(set(text_lengths)) > 1
     
-    def _extract_date(self, row: pd.Series, column_mapping: Dict[str, str]) -> Optional[str]:
-        """Extract and normalize date from row."""
-        if 'date' not in column_mapping:
-            return None
-        
-        date_value = row[column_mapping['date']]
-        if pd.isna(date_value):
-            return None
-        
-        return self._parse_date(str(date_value))
-    
-    def _parse_date(self, date_str: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=4096, typed=True)
+    def _parse_date(date_str: str) -> Optional[str]:
         """
         Parse various date formats and return normalized YYYY-MM-DD format.
         
+        Column detection and the date column conversion parse the same cells,
+        and other formats fall back to strptime attempts and pd.to_datetime,
+        so results are memoized per input.
+        
         Args:
             date_str: Date string to parse
             
@@ -1222,16 +1226,10 @@ class ExcelParser:
         """
         date_str = str(date_str).strip()
         
-        # 如果已经是YYYY-MM-DD格式，验证并返回
-        import re
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
-            try:
-                # 验证日期是否有效
-                datetime.strptime(date_str, '%Y-%m-%d')
-                return date_str
-            except ValueError:
-                # 如果日期无效，继续尝试其他格式
-                pass
+        # 如果已经是有效的YYYY-MM-DD格式直接返回：只做正则匹配和整数比较，不调用strptime；
+        # 日期无效时继续尝试其他格式
+        if is_valid_date_str(date_str):
+            return date_str
         
         # Handle pandas Timestamp objects
         try:
@@ -1240,8 +1238,9 @@ class ExcelParser:
         except:
             pass
         
-        # Try different date formats
-        for fmt in self.DATE_FORMATS:
+        # Try the date formats whose separator appears in the string
+        formats = next((group for separator, group in ExcelParser.DATE_FORMAT_GROUPS if separator in date_str), ())
+        for fmt in formats:
             try:
                 parsed_date = datetime.strptime(date_str, fmt)
                 return parsed_date.strftime('%Y-%m-%d')
@@ -1258,37 +1257,22 @@ class ExcelParser:
         logger.warning(f"Could not parse date: {date_str}")
         return None
     
-    def _extract_meal_type(self, row: pd.Series, column_mapping: Dict[str, str]) -> str:
-        """Extract and normalize meal type from row."""
-        if 'meal_type' in column_mapping:
-            meal_value = row[column_mapping['meal_type']]
-            if not pd.isna(meal_value):
-                normalized = self._normalize_meal_type(str(meal_value))
-                if normalized:
-                    return normalized
-        
-        # Default to lunch if no meal type specified
-        return 'lunch'
-    
-    def _is_likely_category_name(self, text: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_likely_category_name(text: str) -> bool:
         """
         判断文本是否可能是分类名称
         
+        同一分类名在各行、各文件中反复出现，结果按文本缓存。
+        
         Args:
             text: 要判断的文本
             
         Returns:
             True if likely a category name, False otherwise
         """
-        # 已知的分类名称列表
-        known_categories = {
-            '油炸食品', '小菜类', '营养鸡蛋', '粥品', '饮品类', '包点', '清炒时蔬', '传统风味',
-            '荤类', '半荤素', '蔬菜', '主食/面点', '控糖主食', '免费例汤', '炖罐', '捞化档口', 
-            '水果酸奶', '档口特色', '营养例汤', '盖浇饭套餐', '每日下午外卖包点'
-        }
-        
         # 如果是已知分类，直接返回True
-        if text in known_categories:
+        if text in _KNOWN_CATEGORIES:
             return True
         
         # 分类名称的特征：
@@ -1300,12 +1284,8 @@ class ExcelParser:
             return False
         
         # 分类关键词
-        category_keywords = ['类', '品', '食', '汤', '罐', '档', '奶', '特色', '套餐', '包点', '主食', '例汤']
-        has_category_keyword = any(keyword in text for keyword in category_keywords)
-        
-        # 菜品描述词汇（这些通常出现在具体菜品名称中）
-        dish_keywords = ['红烧', '清蒸', '白灼', '爆炒', '糖醋', '麻辣', '香辣', '蒜蓉', '葱爆', '宫保']
-        has_dish_keyword = any(keyword in text for keyword in dish_keywords)
+        has_category_keyword = _CATEGORY_KEYWORD_RE.search(text) is not None
+        has_dish_keyword = _DISH_KEYWORD_RE.search(text) is not None
         
         # 如果包含分类关键词且不包含菜品描述词汇，可能是分类
         if has_category_keyword and not has_dish_keyword:
@@ -1317,10 +1297,14 @@ class ExcelParser:
         
         return False
     
-    def _normalize_meal_type(self, meal_str: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _normalize_meal_type(meal_str: str) -> Optional[str]:
         """
         Normalize meal type string to standard values.
         
+        The same few labels repeat across every sheet, so results are memoized.
+        
         Args:
             meal_str: Raw meal type string
             
@@ -1329,62 +1313,64 @@ class ExcelParser:
         """
         meal_str = meal_str.lower().strip()
         
-        for standard_type, variations in self.MEAL_TYPE_MAPPINGS.items():
-            if any(variation in meal_str for variation in variations):
+        # 恰好是某个已知写法时直接查表，否则按子串匹配
+        exact_match = ExcelParser.MEAL_TYPE_LOOKUP.get(meal_str)
+        if exact_match:
+            return exact_match
+        
+        for standard_type, pattern in ExcelParser.MEAL_TYPE_PATTERNS:
+            if pattern.search(meal_str):
                 return standard_type
         
         return None
     
-    def _extract_meal_time(self, row: pd.Series, column_mapping: Dict[str, str]) -> str:
-        """Extract meal time from row."""
-        if 'time' in column_mapping:
-            time_value = row[column_mapping['time']]
-            if not pd.isna(time_value):
-                time_str = str(time_value).strip()
-                # Try to parse and format time
-                time_match = re.match(r'(\d{1,2}):(\d{2})', time_str)
-                if time_match:
-                    hour, minute = time_match.groups()
-                    return f"{int(hour):02d}:{minute}"
-        
-        # Default times based on meal type (will be set later)
-        return "12:00"
-    
-    def _extract_food_name(self, row: pd.Series, column_mapping: Dict[str, str]) -> Optional[str]:
-        """Extract food name from row."""
-        if 'food_name' not in column_mapping:
-            return None
-        
-        food_value = row[column_mapping['food_name']]
-        if pd.isna(food_value):
-            return None
+    @staticmethod
+    def _map_distinct(values: pd.Series, convert) -> pd.Series:
+        """
+        Convert a column cell by cell, calling convert once per distinct cell text.
         
-        food_name = str(food_value).strip()
-        return food_name if food_name and food_name != 'nan' else None
+        Args:
+            values: Column of raw cell values
+            convert: Function from cell text to converted value
+            
+        Returns:
+            Series of converted values aligned with values; empty cells map to None
+        """
+        codes, uniques = pd.factorize(values.map(str, na_action='ignore'))
+        converted = [convert(text) for text in uniques]
+        # factorize把空单元格编码为-1，正好取到末尾的None
+        converted.append(None)
+        return pd.Series([converted[code] for code in codes], index=values.index, dtype=object)
     
-    def _extract_description(self, row: pd.Series, column_mapping: Dict[str, str]) -> Optional[str]:
-        """Extract description from row."""
-        if 'description' not in column_mapping:
-            return None
-        
-        desc_value = row[column_mapping['description']]
-        if pd.isna(desc_value):
-            return None
+    def _parse_date_column(self, values: pd.Series) -> pd.Series:
+        """
+        Normalize a date column to YYYY-MM-DD strings.
         
-        description = str(desc_value).strip()
-        return description if description and description != 'nan' else None
+        Args:
+            values: Column of raw date cells
+            
+        Returns:
+            Series of date strings aligned with values; unparseable or empty cells map to None
+        """
+        if pd.api.types.is_datetime64_any_dtype(values):
+            # Excel原生日期单元格读入为datetime64列，整列直接格式化，
+            # 不必让每个取值先转成文本再逐个格式尝试失败后回退到pd.to_datetime
+            return values.dt.strftime('%Y-%m-%d').astype(object).where(values.notna(), None)
+        return self._map_distinct(values, self._parse_date)
     
-    def _extract_category(self, row: pd.Series, column_mapping: Dict[str, str]) -> Optional[str]:
-        """Extract category from row."""
-        if 'category' not in column_mapping:
-            return None
-        
-        cat_value = row[column_mapping['category']]
-        if pd.isna(cat_value):
-            return None
-        
-        category = str(cat_value).strip()
-        return category if category and category != 'nan' else None
+    def _parse_meal_time(self, time_str: str) -> Optional[str]:
+        """Normalize an HH:MM meal time cell, or None if it has no time."""
+        time_match = _TIME_PREFIX_RE.match(time_str.strip())
+        if time_match:
+            hour, minute = time_match.groups()
+            return f"{int(hour):02d}:{minute}"
+        return None
+    
+    @staticmethod
+    def _clean_text_value(text: str) -> Optional[str]:
+        """Strip a text cell, treating empty and 'nan' cells as missing."""
+        text = text.strip()
+        return text if text and text != 'nan' else None
     
     def _parse_et_file(self, file_path: Union[str, Path]) -> pd.DataFrame:
         """
@@ -1399,59 +1385,36 @@ class ExcelParser:
         Raises:
             ExcelParsingError: 如果文件无法解析
         """
+        # 按文件头判断实际格式，只尝试对应的一种读取方式，不再逐个引擎试错：
+        # ZIP 容器交给 openpyxl，OLE2 复合文档交给 xlrd，其余按文本CSV读取。
+        # 文件不存在或无权限的异常直接抛出，由调用方给出对应的提示
+        with open(file_path, 'rb') as et_file:
+            head = et_file.read(len(_ZIP_MAGIC))
+        
         try:
-            # 方法1: 尝试使用pandas直接读取（某些情况下pandas可以处理.et文件）
-            try:
-                logger.info(f"尝试使用pandas直接读取.et文件: {file_path}")
-                df = pd.read_excel(file_path, engine='openpyxl')
-                if not df.empty:
-                    logger.info("成功使用pandas读取.et文件")
-                    return df
-            except Exception as e:
-                logger.warning(f"pandas直接读取.et文件失败: {e}")
-            
-            # 方法2: 尝试使用xlrd引擎
-            try:
-                logger.info(f"尝试使用xlrd引擎读取.et文件: {file_path}")
-                df = pd.read_excel(file_path, engine='xlrd')
-                if not df.empty:
-                    logger.info("成功使用xlrd引擎读取.et文件")
-                    return df
-            except Exception as e:
-                logger.warning(f"xlrd引擎读取.et文件失败: {e}")
+            if head.startswith(_ZIP_MAGIC):
+                try:
+                    logger.info(f"使用openpyxl读取.et文件: {file_path}")
+                    df = pd.read_excel(file_path, engine='openpyxl')
+                    if not df.empty:
+                        logger.info("成功使用pandas读取.et文件")
+                        return df
+                except Exception as e:
+                    logger.warning(f"openpyxl读取.et文件失败: {e}")
             
-            # 方法3: 尝试将.et文件当作Excel文件处理
-            try:
-                logger.info(f"尝试将.et文件当作Excel文件处理: {file_path}")
-                # 创建临时文件名，将.et改为.xlsx
-                import tempfile
-                import shutil
-                
-                with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
-                    temp_path = temp_file.name
-                
-                # 复制文件并重命名
-                shutil.copy2(file_path, temp_path)
-                
+            elif head.startswith(_OLE2_MAGIC):
                 try:
-                    df = pd.read_excel(temp_path, engine='openpyxl')
+                    logger.info(f"使用xlrd引擎读取.et文件: {file_path}")
+                    df = pd.read_excel(file_path, engine='xlrd')
                     if not df.empty:
-                        logger.info("成功将.et文件当作Excel文件处理")
+                        logger.info("成功使用xlrd引擎读取.et文件")
                         return df
-                finally:
-                    # 清理临时文件
-                    try:
-                        os.unlink(temp_path)
-                    except:
-                        pass
-                        
-            except Exception as e:
-                logger.warning(f"将.et文件当作Excel文件处理失败: {e}")
+                except Exception as e:
+                    logger.warning(f"xlrd引擎读取.et文件失败: {e}")
             
-            # 方法4: 尝试使用CSV方式读取（某些.et文件可能是文本格式）
-            try:
+            else:
+                # 某些.et文件可能是文本格式，尝试不同的编码
                 logger.info(f"尝试使用CSV方式读取.et文件: {file_path}")
-                # 尝试不同的编码
                 for encoding in ['utf-8', 'gbk', 'gb2312', 'utf-16']:
                     try:
                         df = pd.read_csv(file_path, encoding=encoding, sep=None, engine='python')
@@ -1460,9 +1423,7 @@ class ExcelParser:
                             return df
                     except Exception:
                         continue
-                        
-            except Exception as e:
-                logger.warning(f"CSV方式读取.et文件失败: {e}")
+                logger.warning("CSV方式读取.et文件失败")
             
             # 如果所有方法都失败，抛出异常
             raise ExcelParsingError(
@@ -1490,25 +1451,18 @@ class ExcelParser:
         try:
             logger.info("尝试解析基于星期的菜单格式")
             
-            # 检查是否包含星期信息（在数据行中而不是列名中）
-            has_weekday = False
-            for row_idx in range(min(10, len(df))):  # 检查前10行
-                for col_idx in range(len(df.columns)):
-                    try:
-                        cell_value = str(df.iloc[row_idx, col_idx]).strip()
-                        if any(day in cell_value for day in ['星期一', '星期二', '星期三', '星期四', '星期五', '星期六', '星期日']):
-                            has_weekday = True
-                            logger.info(f"在第{row_idx}行第{col_idx}列发现星期信息: {cell_value}")
-                            break
-                    except:
-                        continue
-                if has_weekday:
-                    break
+            # 检查是否包含星期信息（在数据行中而不是列名中）：前10行转为定长字符串数组，
+            # 每种星期写法整块搜索一次，不再逐格做子串判断
+            texts = _cell_texts(df.iloc[:10].to_numpy(dtype=object)).astype(str)
+            hits = np.logical_or.reduce([np.char.find(texts, day) >= 0 for day in _WEEKDAY_NAMES])
             
-            if not has_weekday:
+            if not hits.any():
                 logger.info("未检测到星期格式")
                 return None
             
+            row_idx, col_idx = np.argwhere(hits)[0]  # 按行优先取第一个命中的单元格
+            logger.info(f"在第{row_idx}行第{col_idx}列发现星期信息: {texts[row_idx, col_idx]}")
+            
             logger.info("检测到基于星期的菜单格式，将使用weekly格式解析")
             
             # 返回一个特殊的标记，表示这是weekly格式
@@ -1518,12 +1472,13 @@ class ExcelParser:
             logger.warning(f"解析基于星期的格式时出错: {e}")
             return None
     
-    def _convert_weekly_to_standard_format(self, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    def _convert_weekly_to_standard_format(self, df: pd.DataFrame, filename: str = '') -> Optional[pd.DataFrame]:
         """
         将基于星期的菜单格式转换为标准格式
         
         Args:
             df: 原始DataFrame
+            filename: 源文件名，用于提取日期范围
             
         Returns:
             转换后的DataFrame，包含标准的日期、餐次、菜品列
@@ -1537,47 +1492,32 @@ class ExcelParser:
             current_year_val = current_year()
             
             # 尝试从文件名中提取月份和日期范围
-            filename = getattr(self, '_current_filename', '')
             logger.info(f"处理文件: {filename}")
             
             # 解析文件名中的日期信息（如：12月29-31）
-            import re
-            date_match = re.search(r'(\d+)月(\d+)-(\d+)', filename)
-            if date_match:
-                month = int(date_match.group(1))
-                start_day = int(date_match.group(2))
-                end_day = int(date_match.group(3))
-                
-                # 生成日期列表
-                dates = []
-                for day in range(start_day, end_day + 1):
-                    try:
-                        from datetime import datetime
-                        date_obj = datetime(current_year_val, month, day)
-                        dates.append(date_obj.strftime('%Y-%m-%d'))
-                    except ValueError:
-                        continue
-                
+            dates = _filename_day_range_dates(filename, current_year_val)
+            if dates is not None:
                 logger.info(f"解析出的日期: {dates}")
                 
                 if not dates:
                     logger.warning("未能解析出有效日期")
                     return None
                 
+                # 整表一次转换为单元格文本，按行遍历，不再逐格调用 df.iloc
+                texts = _cell_texts(df.to_numpy(dtype=object))
+                
                 # 查找星期行
                 weekday_row_idx = None
-                weekday_cols = {}
+                weekday_cols = {}  # 列位置 -> 日期
                 
-                for row_idx in range(len(df)):
-                    for col_idx, col in enumerate(df.columns):
-                        cell_value = str(df.iloc[row_idx, col_idx]).strip()
+                for row_idx, row in enumerate(texts):
+                    for col_idx, cell_value in enumerate(row):
                         if '星期' in cell_value:
                             weekday_row_idx = row_idx
                             # 映射星期到日期
-                            weekdays = ['星期一', '星期二', '星期三', '星期四', '星期五', '星期六', '星期日']
-                            for i, weekday in enumerate(weekdays):
+                            for i, weekday in enumerate(_WEEKDAY_NAMES):
                                 if weekday in cell_value and i < len(dates):
-                                    weekday_cols[col] = dates[i]
+                                    weekday_cols[col_idx] = dates[i]
                             break
                     if weekday_row_idx is not None:
                         break
@@ -1588,41 +1528,39 @@ class ExcelParser:
                     # 处理菜单数据
                     current_meal_type = "早餐"  # 默认餐次
                     
-                    for row_idx in range(len(df)):
+                    for row_idx, row in enumerate(texts):
                         if row_idx == weekday_row_idx:
                             continue
                             
-                        first_col_value = str(df.iloc[row_idx, 0]).strip()
+                        first_col_value = row[0]
                         
                         # 检查是否是餐次标识
-                        if first_col_value in ['早餐', '午餐', '晚餐', 'breakfast', 'lunch', 'dinner']:
+                        if first_col_value in _CONVERT_MEAL_MARKERS:
                             current_meal_type = first_col_value
                             continue
                         
                         # 检查是否是类别行（跳过）
-                        if first_col_value in ['类别', '油炸食品', '小菜类', '营养鸡蛋', '粥品', '饮品类', '包点', '清炒时蔬', '传统风味']:
+                        if first_col_value in _CONVERT_SKIPPED_CATEGORIES:
                             continue
                         
                         # 处理菜品数据
-                        for col, date_str in weekday_cols.items():
-                            if col in df.columns:
-                                col_idx = df.columns.get_loc(col)
-                                food_value = str(df.iloc[row_idx, col_idx]).strip()
-                                
-                                if food_value and food_value != '<NA>' and food_value != 'nan':
-                                    # 分割多个菜品（用逗号、顿号等分隔）
-                                    foods = re.split(r'[，,、/]', food_value)
-                                    for food in foods:
-                                        food = food.strip()
-                                        if food:
-                                            standard_data.append({
-                                                'date': date_str,  # 使用英文列名
-                                                'meal_type': current_meal_type,
-                                                'time': '12:00',  # 默认时间
-                                                'food_name': food,
-                                                'description': '',
-                                                'category': first_col_value if first_col_value not in ['<NA>', 'nan', ''] else ''
-                                            })
+                        for col_idx, date_str in weekday_cols.items():
+                            food_value = row[col_idx]
+                            
+                            if food_value and food_value != '<NA>' and food_value != 'nan':
+                                # 分割多个菜品（用逗号、顿号等分隔）
+                                foods = _WEEKLY_FOOD_SEPARATOR_RE.split(food_value)
+                                for food in foods:
+                                    food = food.strip()
+                                    if food:
+                                        standard_data.append({
+                                            'date': date_str,  # 使用英文列名
+                                            'meal_type': current_meal_type,
+                                            'time': '12:00',  # 默认时间
+                                            'food_name': food,
+                                            'description': '',
+                                            'category': first_col_value if first_col_value not in ['<NA>', 'nan', ''] else ''
+                                        })
                 
                 if standard_data:
                     result_df = pd.DataFrame(standard_data)
@@ -1635,4 +1573,53 @@ class ExcelParser:
             
         except Exception as e:
             logger.error(f"转换基于星期的格式时出错: {e}")
-            return None
\ No newline at end of file
+            return None
+
+
+def _parse_file(file_path: Union[str, Path]) -> Union[List[MenuData], Exception]:
+    """Parse one file with a fresh parser, returning the error instead of raising it."""
+    try:
+        return ExcelParser().parse_excel_file(file_path)
+    except Exception as e:
+        return e
+
+
+# 解析进程池在第一次并行解析时创建，之后的扫描复用，不再每次启动和关闭工作进程
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_workers = 0
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Get the shared parse pool, creating it with the given number of workers.
+    
+    A request for a different number of workers replaces the pool; the old
+    pool still finishes the files already submitted to it.
+    
+    Args:
+        workers: Number of worker processes
+        
+    Returns:
+        The shared process pool
+    """
+    global _parse_pool, _parse_pool_workers
+    with _parse_pool_lock:
+        if _parse_pool is None or _parse_pool_workers != workers:
+            if _parse_pool is not None:
+                _parse_pool.shutdown(wait=False)
+            # 调用方运行在多线程的WSGI服务中，fork 会把其他线程持有的锁（如日志锁）复制进子进程，
+            # 使用 forkserver 从干净的服务进程派生工作进程
+            _parse_pool = ProcessPoolExecutor(max_workers=workers,
+                                              mp_context=multiprocessing.get_context('forkserver'))
+            _parse_pool_workers = workers
+        return _parse_pool
+
+
+def _discard_parse_pool() -> None:
+    """Shut down the shared parse pool; the next parallel parse creates a new one."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False)
+            _parse_pool = None
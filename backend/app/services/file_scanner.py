@@ -2,16 +2,25 @@
 文件扫描服务 - 自动扫描和加载menu目录下的Excel文件
 """
 import os
-import glob
-from typing import List, Dict, Any
+import hashlib
+from typing import List, Dict, Any, Tuple, Union
 from datetime import datetime
 import logging
 
+from flask import current_app, has_app_context
+
 from .excel_parser import ExcelParser
 from ..models import get_storage
+from ..models.menu import MenuData
 
 logger = logging.getLogger(__name__)
 
+# 计算文件内容摘要时每次读取的字节数
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 扫描的菜单文件扩展名（.csv临时支持用于本地测试，.et为WPS表格文件）
+MENU_FILE_EXTENSIONS = ('.xlsx', '.xls', '.et', '.csv')
+
 
 class FileScanner:
     """文件扫描器 - 自动扫描和处理Excel菜单文件"""
@@ -54,9 +63,16 @@ class FileScanner:
                 menu_directory = '/app/menu'
         
         self.menu_directory = menu_directory
-        self.excel_parser = ExcelParser()
         self.storage = get_storage()
         
+        # 解析结果缓存：文件路径 -> (内容摘要, 解析时的年月, 菜单列表)
+        # 日期由文件名和当前年月推断，路径和年月相同且内容未变时解析结果必然相同
+        self._parse_cache: Dict[str, Tuple[str, str, List[MenuData]]] = {}
+        # 摘要索引：文件路径 -> (文件大小, mtime_ns, 内容摘要)，大小和修改时间未变时不再重读文件
+        self._digest_index: Dict[str, Tuple[int, int, str]] = {}
+        # 最近一次目录扫描得到的文件状态：文件路径 -> (文件大小, mtime_ns)
+        self._file_stats: Dict[str, Tuple[int, int]] = {}
+        
         logger.info(f"文件扫描器初始化，扫描目录: {self.menu_directory}")
     
     def scan_and_load_files(self) -> Dict[str, Any]:
@@ -95,10 +111,18 @@ class FileScanner:
             # 清空现有数据
             self.storage.clear_all_data()
             
+            # 丢弃已不在目录中的文件的缓存
+            for stale_path in set(self._parse_cache) - set(excel_files):
+                self._parse_cache.pop(stale_path, None)
+                self._digest_index.pop(stale_path, None)
+            
+            # 各文件并行解析，再按文件名顺序依次存储
+            parsed_files = self._parse_files(excel_files)
+            
             # 处理每个文件
             for file_path in excel_files:
                 try:
-                    self._process_excel_file(file_path, result)
+                    self._process_excel_file(file_path, result, parsed_files[file_path])
                 except Exception as e:
                     error_msg = f"处理文件 {os.path.basename(file_path)} 时出错: {str(e)}"
                     logger.error(error_msg)
@@ -136,50 +160,101 @@ class FileScanner:
         Returns:
             List[str]: Excel文件路径列表
         """
-        excel_patterns = [
-            os.path.join(self.menu_directory, '*.xlsx'),
-            os.path.join(self.menu_directory, '*.xls'),
-            os.path.join(self.menu_directory, '*.et'),   # WPS表格文件
-            os.path.join(self.menu_directory, '*.csv')   # 临时支持CSV文件用于本地测试
-        ]
-        
         excel_files = []
-        for pattern in excel_patterns:
-            files = glob.glob(pattern)
-            # 过滤掉临时文件（以~$开头的文件）
-            valid_files = [f for f in files if not os.path.basename(f).startswith('~$')]
-            excel_files.extend(valid_files)
+        file_stats = {}
+        
+        # 一次scandir遍历目录，DirEntry自带文件类型，stat结果也只取一次
+        try:
+            with os.scandir(self.menu_directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    # 跳过隐藏文件和临时文件（以~$开头的文件）
+                    if name.startswith(('.', '~$')) or not name.endswith(MENU_FILE_EXTENSIONS):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    excel_files.append(entry.path)
+                    file_stats[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        except FileNotFoundError:
+            # 目录不存在时视为没有文件
+            pass
         
-        # 按文件名排序
+        self._file_stats = file_stats
+        
+        # 按文件名排序，同一日期出现在多个文件中时排在后面的文件生效
         excel_files.sort()
         
         logger.info(f"找到有效Excel文件: {[os.path.basename(f) for f in excel_files]}")
         
         return excel_files
     
-    def _process_excel_file(self, file_path: str, result: Dict[str, Any]):
+    def _parse_files(self, excel_files: List[str]) -> Dict[str, Union[List[MenuData], Exception]]:
+        """
+        解析多个Excel文件，内容未变化的文件直接复用缓存的解析结果
+        
+        需要重新解析的文件交给 ExcelParser.parse_many 解析。应用配置 PARSE_WORKERS
+        大于1时在多个进程中并行解析，默认在当前进程内逐个解析
+        
+        Args:
+            excel_files: Excel文件路径列表
+            
+        Returns:
+            Dict: 文件路径 -> 解析出的菜单列表，解析失败时为对应的异常
+        """
+        # 解析器按当前年月推断年份，跨月后重新解析
+        current_month = datetime.now().strftime('%Y-%m')
+        
+        parsed_files: Dict[str, Union[List[MenuData], Exception]] = {}
+        pending: Dict[str, str] = {}  # 需要解析的文件路径 -> 内容摘要
+        for file_path in excel_files:
+            try:
+                digest = self._file_digest(file_path)
+            except Exception as e:
+                parsed_files[file_path] = e
+                continue
+            
+            cached = self._parse_cache.get(file_path)
+            if cached and cached[0] == digest and cached[1] == current_month:
+                logger.info(f"文件 {os.path.basename(file_path)} 内容未变化，复用解析结果")
+                parsed_files[file_path] = cached[2]
+            else:
+                pending[file_path] = digest
+        
+        if pending:
+            # 扫描由请求线程触发，默认不启动子进程，部署时可通过 PARSE_WORKERS 开启
+            workers = current_app.config.get('PARSE_WORKERS', 1) if has_app_context() else 1
+            pending_files = list(pending)
+            for file_path, parsed in zip(pending_files, ExcelParser.parse_many(pending_files, workers)):
+                if not isinstance(parsed, Exception):
+                    self._parse_cache[file_path] = (pending[file_path], current_month, parsed)
+                parsed_files[file_path] = parsed
+        
+        return parsed_files
+    
+    def _process_excel_file(self, file_path: str, result: Dict[str, Any],
+                            parsed: Union[List[MenuData], Exception]):
         """
-        处理单个Excel文件
+        存储单个Excel文件的解析结果
         
         Args:
             file_path: Excel文件路径
             result: 结果字典，用于记录处理结果
+            parsed: 该文件解析出的菜单列表，或解析时抛出的异常
         """
         file_name = os.path.basename(file_path)
         logger.info(f"正在处理文件: {file_name}")
         
         try:
-            # 解析Excel文件
-            menu_data_list = self.excel_parser.parse_excel_file(file_path)
+            if isinstance(parsed, Exception):
+                raise parsed
+            menu_data_list = parsed
             
             if not menu_data_list:
                 raise ValueError("文件中没有找到有效的菜单数据")
             
-            # 存储菜单数据
-            stored_count = 0
-            for menu_data in menu_data_list:
-                self.storage.store_menu_data(menu_data)
-                stored_count += 1
+            # 存储菜单数据，整个文件的菜单一次写入
+            stored_count = self.storage.store_many(menu_data_list)
             
             # 记录成功结果
             dates = []
@@ -201,12 +276,44 @@ class FileScanner:
         except Exception as e:
             raise Exception(f"解析文件失败: {str(e)}")
     
+    def _file_digest(self, file_path: str) -> str:
+        """
+        计算文件内容的BLAKE2b摘要
+        
+        文件大小和修改时间与上次相同时直接返回上次的摘要，否则分块读取整个文件重新计算
+        
+        Args:
+            file_path: 文件路径
+            
+        Returns:
+            十六进制摘要字符串
+        """
+        file_stat = self._file_stats.get(file_path)
+        if file_stat is None:
+            stat = os.stat(file_path)
+            file_stat = (stat.st_size, stat.st_mtime_ns)
+        
+        cached = self._digest_index.get(file_path)
+        if cached and cached[:2] == file_stat:
+            return cached[2]
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        
+        self._digest_index[file_path] = (file_stat[0], file_stat[1], digest)
+        return digest
+    
     def clear_cache(self):
         """
-        清除所有缓存的菜单数据
+        清除所有缓存的菜单数据及文件解析结果缓存
         """
         logger.info("清除菜单缓存...")
         self.storage.clear_all_data()
+        self._parse_cache.clear()
+        self._digest_index.clear()
         logger.info("菜单缓存已清除")
     
     def get_scan_status(self) -> Dict[str, Any]:
@@ -4,6 +4,7 @@
 用于识别横向格式Excel菜单中的餐次分段，支持智能的早餐、午餐、晚餐分类。
 """
 
+import numpy as np
 import pandas as pd
 import re
 import logging
@@ -49,21 +50,27 @@ class MealSegmentIdentifier:
             }
         }
     
-    def identify_meal_segments(self, df: pd.DataFrame, weekday_row_idx: int) -> List[MealSegment]:
+    def identify_meal_segments(self, df: pd.DataFrame, weekday_row_idx: int,
+                               cell_texts: Optional[np.ndarray] = None) -> List[MealSegment]:
         """
         识别餐次分段
         
         Args:
             df: Excel数据DataFrame
             weekday_row_idx: 星期标题行的索引
+            cell_texts: 调用方已计算好的单元格文本网格（去除首尾空白），不传时由df生成
             
         Returns:
             List[MealSegment]: 餐次分段列表
         """
         logger.info(f"开始识别餐次分段，星期行索引: {weekday_row_idx}")
         
-        # 保存DataFrame引用供后续使用
-        self._current_df = df
+        # 整表一次转换为去除首尾空白的字符串网格，后续逐格判断和内容收集直接索引列表，
+        # 不再对每个单元格调用 df.iloc
+        if cell_texts is not None:
+            self._current_cells = cell_texts.tolist()
+        else:
+            self._current_cells = [[str(value).strip() for value in row] for row in df.to_numpy(dtype=object)]
         
         segments = []
         current_segment_start = weekday_row_idx + 1
@@ -71,7 +78,7 @@ class MealSegmentIdentifier:
         
         # 从星期行之后开始扫描
         for row_idx in range(weekday_row_idx + 1, len(df)):
-            first_col_value = str(df.iloc[row_idx, 0]).strip()
+            first_col_value = self._current_cells[row_idx][0]
             
             # 检查是否是餐次分隔符
             if self._is_meal_separator(first_col_value, row_idx, df):
@@ -83,7 +90,7 @@ class MealSegmentIdentifier:
                         start_row=current_segment_start,
                         end_row=row_idx - 1,
                         meal_type=current_meal_type or self._infer_meal_type_from_content(
-                            df, current_segment_start, row_idx - 1
+                            current_segment_start, row_idx - 1
                         )
                     )
                     segments.append(segment)
@@ -99,7 +106,7 @@ class MealSegmentIdentifier:
                 start_row=current_segment_start,
                 end_row=len(df) - 1,
                 meal_type=current_meal_type or self._infer_meal_type_from_content(
-                    df, current_segment_start, len(df) - 1
+                    current_segment_start, len(df) - 1
                 )
             )
             segments.append(segment)
@@ -124,7 +131,7 @@ class MealSegmentIdentifier:
             bool: 是否为分隔符
         """
         # 空值或NaN
-        if not cell_value or cell_value.lower() in ['nan', '']:
+        if not cell_value or cell_value.lower() == 'nan':
             return False
         
         # 明确的餐次标识
@@ -133,8 +140,9 @@ class MealSegmentIdentifier:
         
         # 检查是否是空行（整行都为空）
         if cell_value == 'nan' or not cell_value.strip():
-            row_data = df.iloc[row_idx].astype(str)
-            empty_cells = sum(1 for val in row_data if pd.isna(val) or str(val).strip() in ['', 'nan'])
+            # 直接使用已转换好的单元格文本，不再对整行 astype(str)
+            row_data = self._current_cells[row_idx]
+            empty_cells = sum(1 for val in row_data if val in ('', 'nan'))
             # 如果超过80%的单元格为空，认为是空行分隔符
             if empty_cells / len(row_data) > 0.8:
                 return True
@@ -163,29 +171,18 @@ class MealSegmentIdentifier:
         
         return meal_type_map.get(separator)
     
-    def _infer_meal_type_from_content(self, df: pd.DataFrame, start_row: int, end_row: int) -> str:
+    def _infer_meal_type_from_content(self, start_row: int, end_row: int) -> str:
         """
         基于内容推断餐次类型
         
         Args:
-            df: DataFrame
             start_row: 分段开始行
             end_row: 分段结束行
             
         Returns:
             str: 推断的餐次类型
         """
-        content_text = ""
-        
-        # 收集分段内的所有文本内容
-        for row_idx in range(start_row, end_row + 1):
-            for col_idx in range(len(df.columns)):
-                try:
-                    cell_value = str(df.iloc[row_idx, col_idx]).strip()
-                    if cell_value and cell_value != 'nan':
-                        content_text += cell_value + " "
-                except:
-                    continue
+        content_text = self._extract_content_from_segment_range(start_row, end_row)
         
         logger.debug(f"分段内容文本: {content_text[:100]}...")
         
@@ -250,14 +247,9 @@ class MealSegmentIdentifier:
                     # 检查这个餐次类型是否来自明确的分隔符
                     # 如果分段开始行的前一行包含餐次标识，则认为是明确的
                     if segment.start_row > 0:
-                        prev_row_content = ""
-                        try:
-                            for col_idx in range(len(self._current_df.columns)):
-                                cell_value = str(self._current_df.iloc[segment.start_row - 1, col_idx]).strip()
-                                if cell_value and cell_value != 'nan':
-                                    prev_row_content += cell_value + " "
-                        except:
-                            pass
+                        prev_row_content = self._extract_content_from_segment_range(
+                            segment.start_row - 1, segment.start_row - 1
+                        )
                         
                         # 检查是否包含明确的餐次标识
                         explicit_indicators = ['早餐', '午餐', '晚餐', 'breakfast', 'lunch', 'dinner']
@@ -312,23 +304,16 @@ class MealSegmentIdentifier:
         Returns:
             str: 内容文本
         """
-        if not hasattr(self, '_current_df'):
+        if not hasattr(self, '_current_cells'):
             return ""
         
-        content_text = ""
-        df = self._current_df
-        
-        # 收集分段内的所有文本内容
-        for row_idx in range(start_row, end_row + 1):
-            for col_idx in range(len(df.columns)):
-                try:
-                    cell_value = str(df.iloc[row_idx, col_idx]).strip()
-                    if cell_value and cell_value != 'nan':
-                        content_text += cell_value + " "
-                except:
-                    continue
-        
-        return content_text
+        # 收集分段内的所有文本内容，每个非空单元格后接一个空格
+        return "".join(
+            cell_value + " "
+            for row in self._current_cells[start_row:end_row + 1]
+            for cell_value in row
+            if cell_value and cell_value != 'nan'
+        )
     
     def _calculate_meal_type_score(self, segment: MealSegment, target_meal_type: str) -> float:
         """
@@ -0,0 +1,117 @@
+"""
+JSON序列化工具模块
+
+使用orjson替代标准库json输出API响应，orjson直接生成UTF-8字节，
+序列化速度比json.dumps快数倍
+"""
+
+import gzip
+import hashlib
+from typing import Any, Dict, NamedTuple, Optional
+
+import orjson
+from flask import Response, current_app, request
+from flask.json.provider import DefaultJSONProvider
+
+# 达到该大小的JSON响应才压缩，更小的响应压缩收益抵不过编码开销
+COMPRESS_MIN_SIZE = 1024
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    将对象序列化为JSON字节串
+
+    orjson无法处理的类型（Decimal、UUID等）交给Flask默认处理函数转换
+
+    Args:
+        obj: 要序列化的对象
+
+    Returns:
+        UTF-8编码的JSON字节串
+    """
+    return orjson.dumps(
+        obj, default=DefaultJSONProvider.default, option=orjson.OPT_NON_STR_KEYS
+    )
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and dict responses."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps(obj).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
+
+
+def output_json(
+    data: Any, code: int, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Flask-RESTX的application/json表示函数，替换默认的json.dumps输出
+
+    Args:
+        data: 资源方法返回的数据
+        code: HTTP状态码
+        headers: 额外的响应头
+
+    Returns:
+        JSON响应对象
+    """
+    response = current_app.response_class(
+        dumps(data), status=code, mimetype='application/json'
+    )
+    response.headers.extend(headers or {})
+    return response
+
+
+class PreparedJson(NamedTuple):
+    """Serialized JSON body with its gzip variant and ETag, built once and cached."""
+    body: bytes
+    gzipped: Optional[bytes]
+    etag: str
+
+
+def prepare_json(obj: Any) -> PreparedJson:
+    """
+    序列化对象并预先生成gzip压缩体和ETag，供缓存后直接复用
+
+    Args:
+        obj: 要序列化的对象
+
+    Returns:
+        PreparedJson，小于COMPRESS_MIN_SIZE的响应不生成压缩体
+    """
+    body = dumps(obj)
+    gzipped = gzip.compress(body) if len(body) >= COMPRESS_MIN_SIZE else None
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return PreparedJson(body, gzipped, etag)
+
+
+def prepared_json_response(prepared: PreparedJson) -> Response:
+    """
+    根据Accept-Encoding和If-None-Match返回预序列化的JSON
+
+    客户端支持gzip时直接发送缓存的压缩体；ETag与请求一致时返回304
+
+    Args:
+        prepared: prepare_json生成的缓存结果
+
+    Returns:
+        JSON响应对象
+    """
+    response = current_app.response_class(prepared.body, mimetype='application/json')
+    etag = prepared.etag
+    if prepared.gzipped is not None:
+        response.vary.add('Accept-Encoding')
+        if request.accept_encodings['gzip']:
+            response.set_data(prepared.gzipped)
+            response.headers['Content-Encoding'] = 'gzip'
+            # 不同编码的响应体不同，强ETag需要区分
+            etag += '-gzip'
+    response.set_etag(etag)
+    return response.make_conditional(request)
@@ -5,11 +5,24 @@
 """
 
 import os
+import re
+import time
+from calendar import isleap
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Tuple
 import pytz
 
 
+# YYYY-MM-DD 格式校验，预编译避免每次请求创建datetime对象
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})\Z', re.ASCII)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# 当前时间字符串缓存：(时区名, 过期时间, ISO时间字符串, 日期字符串)
+# 整体替换元组，多线程下读到的总是一致的一组值
+_NOW_STRINGS_TTL = 1.0
+_now_strings_cache = ('', 0.0, '', '')
+
+
 def get_timezone() -> pytz.BaseTzInfo:
     """
     获取当前时区
@@ -40,6 +53,27 @@ def now() -> datetime:
     return datetime.now(tz)
 
 
+def _now_strings() -> Tuple[str, str]:
+    """
+    获取当前时间的ISO字符串和日期字符串，1秒内重复调用直接返回缓存
+    
+    Returns:
+        (ISO时间字符串, YYYY-MM-DD日期字符串)
+    """
+    global _now_strings_cache
+    tz_name = os.environ.get('TZ', 'Asia/Shanghai')
+    cached_tz, expires_at, iso_str, date_str = _now_strings_cache
+    current = time.monotonic()
+    
+    if cached_tz != tz_name or current >= expires_at:
+        dt = now()
+        iso_str = dt.isoformat()
+        date_str = dt.strftime('%Y-%m-%d')
+        _now_strings_cache = (tz_name, current + _NOW_STRINGS_TTL, iso_str, date_str)
+    
+    return iso_str, date_str
+
+
 def today_str() -> str:
     """
     获取当前日期的字符串表示（YYYY-MM-DD格式）
@@ -47,7 +81,7 @@ def today_str() -> str:
     Returns:
         当前日期字符串
     """
-    return now().strftime('%Y-%m-%d')
+    return _now_strings()[1]
 
 
 def current_year() -> int:
@@ -71,7 +105,7 @@ def format_datetime(dt: Optional[datetime] = None) -> str:
         ISO格式的日期时间字符串
     """
     if dt is None:
-        dt = now()
+        return _now_strings()[0]
     elif dt.tzinfo is None:
         # 如果没有时区信息，假设是当前时区
         tz = get_timezone()
@@ -95,4 +129,30 @@ def parse_date_with_timezone(date_str: str) -> datetime:
     
     # 添加当前时区信息
     tz = get_timezone()
-    return tz.localize(dt)
\ No newline at end of file
+    return tz.localize(dt)
+
+
+def is_valid_date_str(date_str: str) -> bool:
+    """
+    校验日期字符串是否为有效的YYYY-MM-DD格式日期
+    
+    与 datetime.strptime(date_str, '%Y-%m-%d') 的判断一致，但要求月和日为两位数，
+    只做正则匹配和整数比较
+    
+    Args:
+        date_str: 日期字符串
+        
+    Returns:
+        是否为有效日期
+    """
+    match = _DATE_RE.match(date_str)
+    if match is None:
+        return False
+    
+    year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    if year < 1 or not 1 <= month <= 12 or day < 1:
+        return False
+    
+    if month == 2 and isleap(year):
+        return day <= 29
+    return day <= _DAYS_IN_MONTH[month - 1]
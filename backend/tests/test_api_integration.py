@@ -2,6 +2,7 @@
 Integration tests for API endpoints.
 """
 
+import gzip
 import pytest
 import tempfile
 import os
@@ -114,4 +115,71 @@ class TestAPIIntegration:
         assert data['count'] == 0
         assert data['dates'] == []
         assert data['dateRange']['start'] is None
-        assert data['dateRange']['end'] is None
\ No newline at end of file
+        assert data['dateRange']['end'] is None
+    
+    def test_cached_responses_follow_storage_updates(self, client, sample_menu_data):
+        """Test that cached menu and dates responses reflect new data."""
+        storage = get_storage()
+        storage.store_menu_data(sample_menu_data)
+        
+        response = client.get('/api/dates')
+        assert response.get_json()['count'] == 1
+        
+        storage.store_menu_data(MenuData(
+            date="2023-12-16",
+            meals=[Meal(type="dinner", time="18:00", items=[MenuItem(name="New Food")])]
+        ))
+        
+        response = client.get('/api/dates')
+        assert response.get_json()['count'] == 2
+        
+        response = client.get('/api/menu?date=2023-12-16')
+        data = response.get_json()
+        assert data['date'] == '2023-12-16'
+        assert data['meals'][0]['items'][0]['name'] == 'New Food'
+    
+    def test_health_conditional_request(self, client, sample_menu_data):
+        """Test that health returns 304 until storage changes."""
+        response = client.get('/api/health')
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        
+        response = client.get('/api/health', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        
+        get_storage().store_menu_data(sample_menu_data)
+        response = client.get('/api/health', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.get_json()['services']['menu_data'] == 'healthy'
+    
+    def test_menu_compression_and_etag(self, client):
+        """Test that large menu responses are gzipped and revalidated by ETag."""
+        items = [MenuItem(name=f"Food {i}", category="Main Course", order=i) for i in range(50)]
+        get_storage().store_menu_data(
+            MenuData(date="2023-12-15", meals=[Meal(type="lunch", time="12:00", items=items)])
+        )
+        
+        plain = client.get('/api/menu?date=2023-12-15')
+        assert 'Content-Encoding' not in plain.headers
+        assert 'Accept-Encoding' in plain.headers['Vary']
+        
+        response = client.get('/api/menu?date=2023-12-15', headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(response.data) == plain.data
+        
+        etag = response.headers['ETag']
+        assert etag != plain.headers['ETag']
+        response = client.get('/api/menu?date=2023-12-15',
+                              headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        assert response.status_code == 304
+        
+        # 小响应不压缩
+        response = client.get('/api/dates', headers={'Accept-Encoding': 'gzip'})
+        assert 'Content-Encoding' not in response.headers
+    
+    def test_trailing_slash_routes(self, client):
+        """Test that API routes answer directly with a trailing slash."""
+        for url in ('/api/menu/', '/api/dates/', '/api/health/', '/api/scanner/status/'):
+            response = client.get(url)
+            assert response.status_code == 200, url
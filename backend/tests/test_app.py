@@ -2,8 +2,10 @@
 Tests for Flask application setup and configuration.
 """
 
+import gzip
 import pytest
-from app import create_app
+import app as app_module
+from app import create_app, _resolve_static
 
 
 class TestAppConfiguration:
@@ -13,6 +15,35 @@ class TestAppConfiguration:
         """Test that Flask app can be created."""
         app = create_app()
         assert app is not None
+    
+    def test_resolve_static(self, tmp_path):
+        """Test static path resolution for existing and missing files."""
+        existing = tmp_path / 'index.html'
+        existing.write_text('<html></html>')
+        
+        assert _resolve_static(str(existing)) == str(existing)
+        assert _resolve_static(str(tmp_path / 'missing.js')) is None
+        assert _resolve_static(str(tmp_path)) is None
+    
+    def test_index_precompressed_variant(self, tmp_path, monkeypatch):
+        """Test that index.html.gz is served when the client accepts gzip."""
+        index = tmp_path / 'index.html'
+        index.write_text('<html></html>')
+        (tmp_path / 'index.html.gz').write_bytes(gzip.compress(b'<html></html>'))
+        monkeypatch.setattr(app_module, 'STATIC_ROOT', str(tmp_path))
+        monkeypatch.setattr(app_module, 'INDEX_PATH', str(index))
+        
+        client = create_app().test_client()
+        response = client.get('/', headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.mimetype == 'text/html'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert gzip.decompress(response.data) == b'<html></html>'
+        
+        response = client.get('/', headers={'Accept-Encoding': 'identity'})
+        assert 'Content-Encoding' not in response.headers
+        assert response.data == b'<html></html>'
 
 
 class TestAPIEndpoints:
@@ -47,6 +78,16 @@ class TestAPIEndpoints:
         assert 'currentDate' in data
         assert 'hasCurrentDate' in data
     
+    def test_ping_endpoint(self, client):
+        """Test that ping returns a JSON pong with a timestamp."""
+        response = client.get('/api/ping')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        
+        data = response.get_json()
+        assert data['message'] == 'pong'
+        assert data['timestamp']
+    
 
     
     def test_menu_endpoint_with_date_parameter(self, client):
@@ -9,7 +9,7 @@ import os
 from pathlib import Path
 from openpyxl import Workbook
 
-from app.services.excel_parser import ExcelParser, ExcelParsingError
+from app.services.excel_parser import ExcelParser, ExcelParsingError, _filename_day_range_dates
 from app.models.menu import MenuData, Meal, MenuItem
 
 
@@ -49,12 +49,22 @@ class TestExcelParser:
         assert self.parser._parse_date("2023/12/15") == "2023-12-15"
         assert self.parser._parse_date("15/12/2023") == "2023-12-15"
         assert self.parser._parse_date("15-12-2023") == "2023-12-15"
+        assert self.parser._parse_date("12/15/2023") == "2023-12-15"
+        assert self.parser._parse_date("2023年12月15日") == "2023-12-15"
         
         # Test invalid dates
         assert self.parser._parse_date("invalid") is None
         assert self.parser._parse_date("2023-13-01") is None
         assert self.parser._parse_date("") is None
     
+    def test_date_format_groups_match_date_formats(self):
+        """Test that the separator groups keep every date format in order."""
+        grouped = [fmt for _, formats in self.parser.DATE_FORMAT_GROUPS for fmt in formats]
+        assert sorted(grouped) == sorted(self.parser.DATE_FORMATS)
+        for separator, formats in self.parser.DATE_FORMAT_GROUPS:
+            assert all(separator in fmt for fmt in formats)
+            assert [fmt for fmt in self.parser.DATE_FORMATS if fmt in formats] == list(formats)
+    
     def test_normalize_meal_type(self):
         """Test meal type normalization."""
         # Test English
@@ -67,10 +77,33 @@ class TestExcelParser:
         assert self.parser._normalize_meal_type("午餐") == "lunch"
         assert self.parser._normalize_meal_type("晚餐") == "dinner"
         
+        # Test variations inside longer text, earlier meal types win
+        assert self.parser._normalize_meal_type("周一午餐菜单") == "lunch"
+        assert self.parser._normalize_meal_type("Lunch / Morning") == "breakfast"
+        
         # Test invalid
         assert self.parser._normalize_meal_type("snack") is None
         assert self.parser._normalize_meal_type("invalid") is None
     
+    def test_is_likely_category_name(self):
+        """Test category name detection."""
+        assert self.parser._is_likely_category_name("每日下午外卖包点") is True
+        assert self.parser._is_likely_category_name("饮品类") is True
+        assert self.parser._is_likely_category_name("米饭") is True
+        assert self.parser._is_likely_category_name("红烧肉") is False
+        assert self.parser._is_likely_category_name("番茄炒鸡蛋配米饭") is False
+        
+        # Repeated names are answered from the cache
+        hits = self.parser._is_likely_category_name.cache_info().hits
+        assert self.parser._is_likely_category_name("饮品类") is True
+        assert self.parser._is_likely_category_name.cache_info().hits == hits + 1
+    
+    def test_get_meal_time(self):
+        """Test default meal times."""
+        assert self.parser._get_meal_time("breakfast") == "07:30"
+        assert self.parser._get_meal_time("dinner") == "18:00"
+        assert self.parser._get_meal_time("snack") == "12:00"
+    
     def test_looks_like_date_column(self):
         """Test date column detection."""
         # Date-like values
@@ -115,6 +148,40 @@ class TestExcelParser:
         short_values = pd.Series(["A", "B", "C"])
         assert self.parser._looks_like_food_name_column(short_values) is False
     
+    def test_classify_column(self):
+        """Test single-pass column classification in priority order."""
+        assert self.parser._classify_column(pd.Series(["12月15日", "lunch"])) == 'date'
+        assert self.parser._classify_column(pd.Series(["午餐", "晚餐"])) == 'meal_type'
+        assert self.parser._classify_column(pd.Series(["07:00~09:00", "11:30~13:00"])) == 'time'
+        assert self.parser._classify_column(pd.Series(["Fish Curry", "Beef Noodle Soup"])) == 'food_name'
+        assert self.parser._classify_column(pd.Series(["A", "B"])) is None
+        assert self.parser._classify_column(pd.Series([], dtype=object)) is None
+    
+    def test_filename_day_range_dates(self):
+        """Test reading the day range of a weekly menu filename."""
+        assert _filename_day_range_dates("菜单12月29-31.xlsx", 2025) == ("2025-12-29", "2025-12-30", "2025-12-31")
+        assert _filename_day_range_dates("菜单2月27-30.xlsx", 2026) == ("2026-02-27", "2026-02-28")
+        assert _filename_day_range_dates("菜单.xlsx", 2026) is None
+    
+    def test_parse_weekly_format(self):
+        """Test the weekly format with meal markers and weekday columns."""
+        df = pd.DataFrame([
+            ['', '星期一', '星期二'],
+            ['早餐', pd.NA, pd.NA],
+            ['粥品', '白粥', '小米粥'],
+            ['午餐', pd.NA, pd.NA],
+            ['荤类', '红烧肉、米饭', pd.NA],
+        ])
+        menu_data_list = self.parser._parse_weekly_format(self.parser._clean_dataframe(df), '菜单12月4-5.xlsx')
+        
+        menus = {menu.date[5:]: menu for menu in menu_data_list}
+        assert sorted(menus) == ['12-04', '12-05']
+        monday = menus['12-04']
+        assert [meal.type for meal in monday.meals] == ['breakfast', 'lunch']
+        assert [item.name for item in monday.get_meal_by_type('lunch').items] == ['红烧肉', '米饭']
+        assert [item.category for item in monday.get_meal_by_type('breakfast').items] == ['粥品']
+        assert [meal.type for meal in menus['12-05'].meals] == ['breakfast']
+    
     def create_test_excel_file(self, data, filename="test_menu.xlsx"):
         """Helper method to create test Excel files."""
         temp_dir = tempfile.gettempdir()
@@ -162,6 +229,27 @@ class TestExcelParser:
             except (OSError, PermissionError):
                 pass  # Ignore cleanup errors on Windows
     
+    def test_parse_excel_file_native_dates(self):
+        """Test parsing an Excel file whose date cells are real Excel dates."""
+        test_data = {
+            'Date': pd.to_datetime(['2023-12-15 00:00', '2023-12-15 08:30', None, '2023-12-16 00:00']),
+            'Meal Type': ['breakfast', 'lunch', 'lunch', 'dinner'],
+            'Food Name': ['Pancakes', 'Chicken Rice', 'Orphan', 'Noodles']
+        }
+        
+        file_path = self.create_test_excel_file(test_data, "test_native_dates.xlsx")
+        
+        try:
+            menu_data_list = self.parser.parse_excel_file(file_path)
+            assert [m.date for m in menu_data_list] == ['2023-12-15', '2023-12-16']
+            assert [meal.type for meal in menu_data_list[0].meals] == ['breakfast', 'lunch']
+        finally:
+            try:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+            except (OSError, PermissionError):
+                pass
+    
     def test_parse_excel_file_invalid_format(self):
         """Test parsing file with invalid format."""
         # Create a text file with .xlsx extension
@@ -183,6 +271,28 @@ class TestExcelParser:
         with pytest.raises(ExcelParsingError, match="File not found"):
             self.parser.parse_excel_file("nonexistent.xlsx")
     
+    def test_parse_many(self):
+        """Test parsing several files in worker processes."""
+        test_data = {
+            'Date': ['2023-12-15', '2023-12-15'],
+            'Meal Type': ['lunch', 'lunch'],
+            'Food Name': ['Chicken Rice', 'Beef Noodles']
+        }
+        file_path = self.create_test_excel_file(test_data, "test_parse_many.xlsx")
+        
+        try:
+            for workers in (1, 2):
+                parsed, missing = ExcelParser.parse_many([file_path, "nonexistent.xlsx"], workers=workers)
+                assert [menu.date for menu in parsed] == ['2023-12-15']
+                assert len(parsed[0].meals[0].items) == 2
+                assert isinstance(missing, ExcelParsingError)
+        finally:
+            try:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+            except (OSError, PermissionError):
+                pass
+    
     def test_parse_excel_file_empty(self):
         """Test parsing empty Excel file."""
         # Create empty Excel file
@@ -220,6 +330,12 @@ class TestExcelParser:
         # Check that we have the expected columns
         assert 'A' in cleaned_df.columns
         assert 'C' in cleaned_df.columns
+        
+        # Completely empty rows are removed, original row labels are kept
+        df.loc[1, 'C'] = None
+        cleaned_df = self.parser._clean_dataframe(df)
+        assert list(cleaned_df.index) == [0, 2, 3]
+        assert list(cleaned_df.columns) == ['A', 'C']
     
     def test_identify_columns_by_name(self):
         """Test column identification by column names."""
@@ -279,6 +395,23 @@ class TestExcelParser:
                     assert item.name is not None
                     assert len(item.name.strip()) > 0
     
+    def test_parse_standard_format_meal_order(self):
+        """Test meals with equal times keep the order of their first valid row."""
+        data = {
+            'Date': ['2023-12-15', '2023-12-15', '2023-12-15'],
+            'Meal': ['lunch', 'dinner', 'lunch'],
+            'Hour': ['25:00', '12:00', '12:00'],
+            'Food': ['Dropped Dish', 'Beef Steak', 'Grilled Chicken Rice']
+        }
+        df = pd.DataFrame(data)
+        
+        menu_data_list = self.parser._parse_standard_format(df)
+        
+        # 第一行的午餐时间无效，午餐从第三行才开始，排在晚餐之后
+        meals = menu_data_list[0].meals
+        assert [meal.type for meal in meals] == ['dinner', 'lunch']
+        assert [item.name for item in meals[1].items] == ['Grilled Chicken Rice']
+    
     def test_parse_et_file_error_handling(self):
         """Test .et file parsing error handling."""
         # Create a temporary file with .et extension but invalid content
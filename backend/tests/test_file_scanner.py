@@ -0,0 +1,52 @@
+"""
+Tests for the file scanner service.
+"""
+
+import os
+import pytest
+import pandas as pd
+
+from app.models import get_storage
+from app.services.excel_parser import ExcelParser
+from app.services.file_scanner import FileScanner
+
+
+class TestFileScanner:
+    """Test cases for FileScanner class."""
+    
+    @pytest.fixture
+    def menu_dir(self, tmp_path):
+        """Create a menu directory with one standard format file."""
+        data = {
+            'Date': ['2023-12-15', '2023-12-16'],
+            'Meal Type': ['lunch', 'lunch'],
+            'Food Name': ['Chicken Rice', 'Beef Noodles']
+        }
+        pd.DataFrame(data).to_excel(tmp_path / 'menu.xlsx', index=False)
+        yield tmp_path
+        get_storage().clear_all_data()
+    
+    def test_unchanged_file_is_not_reparsed(self, menu_dir, monkeypatch):
+        """Test that rescanning an unchanged file reuses the parsed result."""
+        scanner = FileScanner(str(menu_dir))
+        calls = []
+        parse = ExcelParser.parse_excel_file
+        monkeypatch.setattr(ExcelParser, 'parse_excel_file',
+                            lambda parser, path: calls.append(path) or parse(parser, path))
+        
+        assert scanner.scan_and_load_files()['total_menus'] == 2
+        assert scanner.scan_and_load_files()['total_menus'] == 2
+        assert len(calls) == 1
+        assert get_storage().get_available_dates() == ['2023-12-15', '2023-12-16']
+        
+        # 内容变化后重新解析
+        data = {'Date': ['2023-12-17'], 'Meal Type': ['lunch'], 'Food Name': ['Fried Rice']}
+        pd.DataFrame(data).to_excel(menu_dir / 'menu.xlsx', index=False)
+        os.utime(menu_dir / 'menu.xlsx', ns=(0, 0))
+        assert scanner.scan_and_load_files()['total_menus'] == 1
+        assert len(calls) == 2
+        
+        # 清除缓存后强制重新解析
+        scanner.clear_cache()
+        scanner.scan_and_load_files()
+        assert len(calls) == 3
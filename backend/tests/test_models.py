@@ -89,6 +89,15 @@ class TestMeal:
         
         meal = Meal(type="dinner", time="invalid")
         assert meal.validate() is False
+        
+        meal = Meal(type="dinner", time="18:60")
+        assert meal.validate() is False
+        
+        meal = Meal(type="dinner", time="18:00 ")
+        assert meal.validate() is False
+        
+        meal = Meal(type="breakfast", time="7:30")
+        assert meal.validate() is True
     
     def test_meal_add_item(self):
         """Test adding items to meal."""
@@ -119,6 +128,34 @@ class TestMeal:
         result = meal.remove_item("Pizza")
         assert result is False
         assert len(meal.items) == 1
+    
+    def test_meal_items_kept_sorted(self):
+        """Test that items stay ordered by category order and item order."""
+        meal = Meal(type="lunch", time="12:00", items=[
+            MenuItem(name="Soup", category_order=1, order=0),
+            MenuItem(name="Rice", category_order=0, order=1),
+        ])
+        meal.add_item(MenuItem(name="Noodles", category_order=0, order=0))
+        meal.add_item(MenuItem(name="Tea", category_order=1, order=0))
+        
+        names = [item['name'] for item in meal.to_dict()['items']]
+        assert names == ["Noodles", "Rice", "Soup", "Tea"]
+    
+    def test_meal_add_items(self):
+        """Test adding several items at once."""
+        meal = Meal(type="lunch", time="12:00", items=[MenuItem(name="Soup", category_order=1, order=0)])
+        meal.add_items([
+            MenuItem(name="Tea", category_order=1, order=0),
+            MenuItem(name=""),
+            MenuItem(name="Rice", category_order=0, order=1),
+            MenuItem(name="Noodles", category_order=0, order=0),
+        ])
+        
+        names = [item.name for item in meal.items]
+        assert names == ["Noodles", "Rice", "Soup", "Tea"]
+        
+        meal.add_items([])
+        assert len(meal.items) == 4
 
 
 class TestMenuData:
@@ -142,6 +179,25 @@ class TestMenuData:
         
         menu = MenuData(date="2023-13-01")  # Invalid month
         assert menu.validate() is False
+        
+        menu = MenuData(date="2023-02-29")  # Not a leap year
+        assert menu.validate() is False
+        
+        menu = MenuData(date="2024-02-29")
+        assert menu.validate() is True
+    
+    def test_menu_data_revalidated_after_change(self):
+        """Test that changes made after validation are validated again."""
+        meal = Meal(type="lunch", time="12:00", items=[MenuItem(name="Rice")])
+        menu = MenuData(date="2023-12-15", meals=[meal])
+        assert menu.validate() is True
+        
+        menu.date = "garbage"
+        assert menu.validate() is False
+        
+        menu.date = "2023-12-15"
+        meal.items.append(MenuItem(name=""))
+        assert menu.validate() is False
     
     def test_menu_data_add_meal(self):
         """Test adding meals to menu data."""
@@ -167,6 +223,17 @@ class TestMenuData:
         
         found_dinner = menu.get_meal_by_type("dinner")
         assert found_dinner is None
+        
+        # 同类型多个餐次时返回时间最早的一个
+        early_lunch = Meal(type="lunch", time="11:00")
+        menu.add_meal(early_lunch)
+        assert menu.get_meal_by_type("lunch") is early_lunch
+        assert MenuData(date="2023-12-15", meals=[lunch, early_lunch]).get_meal_by_type("lunch") is early_lunch
+        
+        # 直接追加到meals列表的餐次也能找到
+        dinner = Meal(type="dinner", time="18:00")
+        menu.meals.append(dinner)
+        assert menu.get_meal_by_type("dinner") is dinner
 
 
 class TestMenuStorage:
@@ -224,6 +291,18 @@ class TestMenuStorage:
         assert most_recent is not None
         assert most_recent.date == "2023-12-16"  # Latest date
     
+    def test_dates_stay_sorted_after_delete(self):
+        """Test that the date index follows stores, overwrites and deletes."""
+        storage = MenuStorage()
+        for date in ["2023-12-16", "2023-12-14", "2023-12-15", "2023-12-14"]:
+            storage.store_menu_data(MenuData(date=date))
+        assert storage.get_available_dates() == ["2023-12-14", "2023-12-15", "2023-12-16"]
+        
+        storage.delete_menu_data("2023-12-16")
+        assert storage.get_available_dates() == ["2023-12-14", "2023-12-15"]
+        assert storage.get_date_range() == ("2023-12-14", "2023-12-15")
+        assert storage.get_most_recent_menu().date == "2023-12-15"
+    
     def test_get_menu_or_fallback(self):
         """Test fallback menu retrieval."""
         storage = MenuStorage()
@@ -242,6 +321,22 @@ class TestMenuStorage:
         assert result is not None
         assert result.date == "2023-12-15"  # Fallback to available menu
     
+    def test_resolve_menu(self):
+        """Test resolving a menu with fallback flag."""
+        storage = MenuStorage()
+        assert storage.resolve_menu("2023-12-15") == (None, False)
+        
+        for date in ["2023-12-14", "2023-12-16"]:
+            storage.store_menu_data(MenuData(date=date))
+        
+        menu, is_fallback = storage.resolve_menu("2023-12-14")
+        assert menu.date == "2023-12-14"
+        assert is_fallback is False
+        
+        menu, is_fallback = storage.resolve_menu("2023-12-20")
+        assert menu.date == "2023-12-16"
+        assert is_fallback is True
+    
     def test_clear_all_data(self):
         """Test clearing all data."""
         storage = MenuStorage()
@@ -257,4 +352,35 @@ class TestMenuStorage:
         # Clear all data
         storage.clear_all_data()
         assert storage.get_menu_count() == 0
-        assert len(storage.get_uploaded_files()) == 0
\ No newline at end of file
+        assert len(storage.get_uploaded_files()) == 0
+    
+    def test_store_many(self):
+        """Test storing several menus at once, skipping invalid ones."""
+        storage = MenuStorage()
+        storage.store_menu_data(MenuData(date="2023-12-15"))
+        version = storage.version
+        
+        stored = storage.store_many([
+            MenuData(date="2023-12-17"),
+            MenuData(date="invalid-date"),
+            MenuData(date="2023-12-14"),
+        ])
+        assert stored == 2
+        assert storage.version != version
+        assert storage.get_available_dates() == ["2023-12-14", "2023-12-15", "2023-12-17"]
+        assert storage.store_many([MenuData(date="invalid-date")]) == 0
+    
+    def test_version_changes_on_mutation(self):
+        """Test that the storage version changes whenever data changes."""
+        storage = MenuStorage()
+        initial_version = storage.version
+        
+        storage.store_menu_data(MenuData(date="2023-12-15"))
+        after_store = storage.version
+        assert after_store != initial_version
+        
+        storage.get_menu_by_date("2023-12-15")
+        assert storage.version == after_store
+        
+        storage.delete_menu_data("2023-12-15")
+        assert storage.version != after_store
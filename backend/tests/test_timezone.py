@@ -14,7 +14,8 @@ from app.utils.timezone import (
     today_str,
     current_year,
     format_datetime,
-    parse_date_with_timezone
+    parse_date_with_timezone,
+    is_valid_date_str
 )
 
 
@@ -104,4 +105,16 @@ class TestTimezone:
             parsed_date = parse_date_with_timezone('2023-12-15')
             
             assert current_time.tzinfo.zone == tz.zone
-            assert parsed_date.tzinfo.zone == tz.zone
\ No newline at end of file
+            assert parsed_date.tzinfo.zone == tz.zone
+    
+    def test_is_valid_date_str(self):
+        """测试日期字符串校验"""
+        assert is_valid_date_str('2023-12-15') is True
+        assert is_valid_date_str('2024-02-29') is True
+        assert is_valid_date_str('2023-02-29') is False
+        assert is_valid_date_str('2023-13-01') is False
+        assert is_valid_date_str('2023-11-31') is False
+        assert is_valid_date_str('2023-12-00') is False
+        assert is_valid_date_str('2023-1-01') is False
+        assert is_valid_date_str('2023-12-15\n') is False
+        assert is_valid_date_str('invalid-date') is False